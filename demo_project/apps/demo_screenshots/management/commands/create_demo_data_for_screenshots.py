@@ -1,10 +1,18 @@
+from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Count
 from django.utils import timezone
 from datetime import timedelta
 
+from demo_project.apps.videos.models import Video
 from django_messaging.models import ChatRoom, ChatMembership, Message
 
+BULK_BATCH_SIZE = settings.SEED_BULK_CREATE_BATCH_SIZE
+
 
 class Command(BaseCommand):
     help = "Create demo users and conversations for screenshots"
@@ -16,6 +24,7 @@ class Command(BaseCommand):
             help="Clear existing demo data before creating new data",
         )
 
+    @transaction.atomic
     def handle(self, *args, **options):
         if options["clear"]:
             self.stdout.write("Clearing existing demo data...")
@@ -43,52 +52,79 @@ class Command(BaseCommand):
             {"first_name": "Ravi", "last_name": "Sharma"},
         ]
 
-        users = {}
         for user_data in users_data:
-            username = (
+            user_data["username"] = (
                 f"{user_data['first_name'].lower()}.{user_data['last_name'].lower()}"
             )
-            email = f"{username}@example.com"
-
-            user, created = User.objects.get_or_create(
-                username=username,
-                defaults={
-                    "first_name": user_data["first_name"],
-                    "last_name": user_data["last_name"],
-                    "email": email,
-                    "is_active": True,
-                },
+
+        # Existing users are only used as foreign key targets below
+        users_by_username = User.objects.only(
+            "id", "username", "first_name", "last_name"
+        ).in_bulk(
+            [user_data["username"] for user_data in users_data],
+            field_name="username",
+        )
+        missing_users_data = [
+            user_data
+            for user_data in users_data
+            if user_data["username"] not in users_by_username
+        ]
+        # Only pay for the password hash when there are users to create
+        hashed_password = make_password("pass123") if missing_users_data else None
+        new_users = [
+            User(
+                username=user_data["username"],
+                first_name=user_data["first_name"],
+                last_name=user_data["last_name"],
+                email=f"{user_data['username']}@example.com",
+                is_active=True,
+                password=hashed_password,
             )
-            if created:
-                user.set_password("pass123")
-                user.save()
-                self.stdout.write(f"Created user: {username}")
+            for user_data in missing_users_data
+        ]
+        User.objects.bulk_create(new_users, batch_size=BULK_BATCH_SIZE)
+        for user in new_users:
+            users_by_username[user.username] = user
+            self.stdout.write(f"Created user: {user.username}")
 
-            users[user_data["first_name"].lower()] = user
+        users = {
+            user_data["first_name"].lower(): users_by_username[user_data["username"]]
+            for user_data in users_data
+        }
 
         base_time = timezone.now() - timedelta(hours=2)
+        # Memberships of new chats are inserted together at the end, and since
+        # created_at is set on insert, all conversations are backdated there too
+        memberships = []
+        backdated_messages = []
 
-        existing_chat1 = ChatRoom.objects.filter(
-            is_group=False,
-            is_room=False,
-            content_type=None,
-            object_id=None,
-            members__in=[users["emma"], users["leo"]],
-        ).distinct().first()
+        # Annotate before the member filters so the count covers every member
+        existing_chat1 = (
+            ChatRoom.objects.filter(
+                is_group=False, is_room=False, content_type=None, object_id=None
+            )
+            .annotate(member_count=Count("members"))
+            .filter(member_count=2)
+            .filter(members=users["emma"])
+            .filter(members=users["leo"])
+            .first()
+        )
 
-        if existing_chat1 and existing_chat1.members.count() == 2:
+        if existing_chat1:
             chat1 = existing_chat1
             created = False
         else:
             chat1 = ChatRoom.objects.create(
                 title="", is_group=False, is_room=False
             )
-            ChatMembership.objects.create(
-                chat=chat1, user=users["emma"], role=ChatMembership.Role.ADMIN
-            )
-            ChatMembership.objects.create(
-                chat=chat1, user=users["leo"], role=ChatMembership.Role.MEMBER
-            )
+            memberships += [
+                ChatMembership(
+                    chat=chat1, user=users["emma"], role=ChatMembership.Role.ADMIN
+                ),
+                ChatMembership(
+                    chat=chat1, user=users["leo"], role=ChatMembership.Role.MEMBER
+                ),
+            ]
             created = True
 
             messages_1 = [
@@ -124,37 +160,34 @@ class Command(BaseCommand):
                 ),
             ]
 
-            for sender, content, minutes_offset in messages_1:
-                msg = Message.objects.create(
-                    chat=chat1,
-                    sender=sender,
-                    content=content,
-                )
-                msg.created_at = base_time + timedelta(minutes=minutes_offset)
-                msg.save(update_fields=["created_at"])
+            backdated_messages += self._create_messages(
+                chat1, messages_1, base_time
+            )
 
             self.stdout.write("Created conversation 1: Emma and Leo")
 
-        existing_chat2 = ChatRoom.objects.filter(
+        # The existing room is never read, so only check that it is there
+        chat2_exists = ChatRoom.objects.filter(
             title="Team Beta", is_group=True, is_room=False
-        ).first()
+        ).exists()
 
-        if existing_chat2:
-            chat2 = existing_chat2
+        if chat2_exists:
             created = False
         else:
             chat2 = ChatRoom.objects.create(
                 title="Team Beta", is_group=True, is_room=False
             )
-            ChatMembership.objects.create(
-                chat=chat2, user=users["maya"], role=ChatMembership.Role.ADMIN
-            )
-            ChatMembership.objects.create(
-                chat=chat2, user=users["ethan"], role=ChatMembership.Role.MEMBER
-            )
-            ChatMembership.objects.create(
-                chat=chat2, user=users["sofia"], role=ChatMembership.Role.MEMBER
-            )
+            memberships += [
+                ChatMembership(
+                    chat=chat2, user=users["maya"], role=ChatMembership.Role.ADMIN
+                ),
+                ChatMembership(
+                    chat=chat2, user=users["ethan"], role=ChatMembership.Role.MEMBER
+                ),
+                ChatMembership(
+                    chat=chat2, user=users["sofia"], role=ChatMembership.Role.MEMBER
+                ),
+            ]
             created = True
 
             messages_2 = [
@@ -191,20 +224,12 @@ class Command(BaseCommand):
                 (users["maya"], "Works for me. Let's make this release shine!", 15),
             ]
 
-            for sender, content, minutes_offset in messages_2:
-                msg = Message.objects.create(
-                    chat=chat2,
-                    sender=sender,
-                    content=content,
-                )
-                msg.created_at = base_time + timedelta(minutes=minutes_offset)
-                msg.save(update_fields=["created_at"])
+            backdated_messages += self._create_messages(
+                chat2, messages_2, base_time
+            )
 
             self.stdout.write("Created conversation 2: Maya, Ethan, and Sofia")
 
-        from demo_project.apps.videos.models import Video
-        from django.contrib.contenttypes.models import ContentType
-
         video, video_created = Video.objects.get_or_create(
             title="How to PRIORITIZE IDEAS in Meetings Fast (Impact Effort Matrix)",
             defaults={
@@ -231,15 +256,12 @@ class Command(BaseCommand):
         )
 
         if created:
-            ChatMembership.objects.create(
-                chat=chat3, user=users["noah"], role=ChatMembership.Role.MEMBER
-            )
-            ChatMembership.objects.create(
-                chat=chat3, user=users["lena"], role=ChatMembership.Role.MEMBER
-            )
-            ChatMembership.objects.create(
-                chat=chat3, user=users["ravi"], role=ChatMembership.Role.MEMBER
-            )
+            memberships += [
+                ChatMembership(
+                    chat=chat3, user=users[name], role=ChatMembership.Role.MEMBER
+                )
+                for name in ("noah", "lena", "ravi")
+            ]
 
             messages_3 = [
                 (
@@ -274,19 +296,34 @@ class Command(BaseCommand):
                 ),
             ]
 
-            for sender, content, minutes_offset in messages_3:
-                msg = Message.objects.create(
-                    chat=chat3,
-                    sender=sender,
-                    content=content,
-                )
-                msg.created_at = base_time + timedelta(minutes=minutes_offset)
-                msg.save(update_fields=["created_at"])
+            backdated_messages += self._create_messages(
+                chat3, messages_3, base_time
+            )
 
             self.stdout.write(
                 "Created conversation 3: Noah, Lena, and Ravi (video room)"
             )
 
+        ChatMembership.objects.bulk_create(memberships, batch_size=BULK_BATCH_SIZE)
+
+        if backdated_messages:
+            Message.objects.bulk_update(
+                backdated_messages, ["created_at"], batch_size=BULK_BATCH_SIZE
+            )
+
         self.stdout.write(
             self.style.SUCCESS("Successfully created demo data for screenshots!")
         )
+
+    def _create_messages(self, chat, messages, base_time):
+        """Bulk-insert a conversation and return its messages with backdated times"""
+        created_messages = Message.objects.bulk_create(
+            [
+                Message(chat=chat, sender=sender, content=content)
+                for sender, content, minutes_offset in messages
+            ],
+            batch_size=BULK_BATCH_SIZE,
+        )
+        for msg, (sender, content, minutes_offset) in zip(created_messages, messages):
+            msg.created_at = base_time + timedelta(minutes=minutes_offset)
+        return created_messages
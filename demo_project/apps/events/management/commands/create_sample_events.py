@@ -1,6 +1,9 @@
+from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from django.utils import timezone
 from datetime import timedelta
 import random
@@ -8,6 +11,8 @@ import random
 from demo_project.apps.events.models import Event
 from django_messaging.models import ChatRoom, ChatMembership
 
+BULK_BATCH_SIZE = settings.SEED_BULK_CREATE_BATCH_SIZE
+
 
 class Command(BaseCommand):
     help = 'Create sample events and chat rooms for demonstration'
@@ -19,32 +24,15 @@ class Command(BaseCommand):
             help='Clear existing sample events before creating new data',
         )
 
+    @transaction.atomic
     def handle(self, *args, **options):
         if options['clear']:
             self.stdout.write('Clearing existing sample events...')
             Event.objects.all().delete()
             # Clear chat rooms that are attached to events
-            event_ct = ContentType.objects.get_for_model(Event)
-            ChatRoom.objects.filter(content_type=event_ct).delete()
-
-        # Get or create sample users
-        users = []
-        for i in range(5):
-            username = f'user{i+1}'
-            user, created = User.objects.get_or_create(
-                username=username,
-                defaults={
-                    'first_name': f'User',
-                    'last_name': f'{i+1}',
-                    'email': f'{username}@example.com',
-                    'is_active': True,
-                }
-            )
-            if created:
-                user.set_password('password123')
-                user.save()
-                self.stdout.write(f'Created user: {username}')
-            users.append(user)
+            ChatRoom.objects.filter(
+                content_type=ContentType.objects.get_for_model(Event)
+            ).delete()
 
         # Create sample events
         now = timezone.now()
@@ -91,46 +79,99 @@ class Command(BaseCommand):
             },
         ]
 
-        for event_info in event_data:
-            event, created = Event.objects.get_or_create(
-                title=event_info['title'],
-                defaults={
-                    **event_info,
-                    'organizer': random.choice(users),
-                }
-            )
-            if created:
-                self.stdout.write(f'Created event: {event.title}')
-                
-                # Create chat room for event
-                content_type = ContentType.objects.get_for_model(Event)
-                room, room_created = ChatRoom.objects.get_or_create(
-                    content_type=content_type,
-                    object_id=event.pk,
-                    defaults={
-                        'title': f"Discussion: {event.title}",
-                        'is_room': True,
-                        'is_group': True,
-                    }
-                )
-                if room_created:
-                    # Add some random users to the room
-                    room_member_count = min(random.randint(2, 4), len(users))
-                    for user in random.sample(users, room_member_count):
-                        ChatMembership.objects.get_or_create(
-                            chat=room,
-                            user=user,
-                            defaults={'role': ChatMembership.Role.MEMBER}
-                        )
-                    self.stdout.write(f'Created chat room for event: {event.title}')
-
-        # Create some standalone chat rooms for event community
         standalone_rooms = [
             {'title': 'Event Planning', 'description': 'Discuss upcoming events and ideas'},
             {'title': 'Tech Networking', 'description': 'Connect with other tech professionals'},
             {'title': 'General Discussion', 'description': 'General chat for all community members'},
         ]
 
+        existing_titles = set(
+            Event.objects.filter(
+                title__in=[event_info['title'] for event_info in event_data]
+            ).values_list('title', flat=True)
+        )
+
+        # Nothing to do when a previous run already seeded every event and room
+        standalone_titles = [room_info['title'] for room_info in standalone_rooms]
+        if (
+            len(existing_titles) == len(event_data)
+            and ChatRoom.objects.filter(
+                title__in=standalone_titles,
+                is_room=True,
+                content_type=None,
+                object_id=None,
+            ).count() == len(standalone_titles)
+        ):
+            self.stdout.write(
+                self.style.SUCCESS('Sample events and chat rooms already exist.')
+            )
+            return
+
+        # Only looked up once there is something to seed
+        event_ct = ContentType.objects.get_for_model(Event)
+
+        # Get or create sample users
+        usernames = [f'user{i+1}' for i in range(5)]
+        users_by_username = User.objects.in_bulk(usernames, field_name='username')
+        missing_users = [
+            (i, username)
+            for i, username in enumerate(usernames, start=1)
+            if username not in users_by_username
+        ]
+        # Only pay for the password hash when there are users to create
+        hashed_password = make_password('password123') if missing_users else None
+        new_users = [
+            User(
+                username=username,
+                first_name='User',
+                last_name=f'{i}',
+                email=f'{username}@example.com',
+                is_active=True,
+                password=hashed_password,
+            )
+            for i, username in missing_users
+        ]
+        User.objects.bulk_create(new_users, batch_size=BULK_BATCH_SIZE)
+        for user in new_users:
+            users_by_username[user.username] = user
+            self.stdout.write(f'Created user: {user.username}')
+        users = [users_by_username[username] for username in usernames]
+
+        new_events = Event.objects.bulk_create(
+            [
+                Event(**event_info, organizer=random.choice(users))
+                for event_info in event_data
+                if event_info['title'] not in existing_titles
+            ],
+            batch_size=BULK_BATCH_SIZE,
+        )
+
+        # Memberships for all new rooms are inserted together at the end
+        memberships = []
+
+        for event in new_events:
+            self.stdout.write(f'Created event: {event.title}')
+
+            # Create chat room for event
+            room, room_created = ChatRoom.objects.get_or_create(
+                content_type=event_ct,
+                object_id=event.pk,
+                defaults={
+                    'title': f"Discussion: {event.title}",
+                    'is_room': True,
+                    'is_group': True,
+                }
+            )
+            if room_created:
+                # Add some random users to the room
+                room_member_count = min(random.randint(2, 4), len(users))
+                memberships.extend(
+                    ChatMembership(chat=room, user=user, role=ChatMembership.Role.MEMBER)
+                    for user in random.sample(users, room_member_count)
+                )
+                self.stdout.write(f'Created chat room for event: {event.title}')
+
+        # Create some standalone chat rooms for event community
         for room_info in standalone_rooms:
             room, created = ChatRoom.objects.get_or_create(
                 title=room_info['title'],
@@ -146,12 +187,14 @@ class Command(BaseCommand):
                 
                 # Add some users to the room
                 room_user_count = min(random.randint(2, 5), len(users))
-                for user in random.sample(users, room_user_count):
-                    ChatMembership.objects.get_or_create(
-                        chat=room,
-                        user=user,
-                        defaults={'role': ChatMembership.Role.MEMBER}
-                    )
+                memberships.extend(
+                    ChatMembership(chat=room, user=user, role=ChatMembership.Role.MEMBER)
+                    for user in random.sample(users, room_user_count)
+                )
+
+        ChatMembership.objects.bulk_create(
+            memberships, batch_size=BULK_BATCH_SIZE, ignore_conflicts=True
+        )
 
         self.stdout.write(
             self.style.SUCCESS('Successfully created sample events and chat rooms!')
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-15 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="event",
+            name="title",
+            field=models.CharField(max_length=200, unique=True),
+        ),
+    ]
@@ -6,14 +6,16 @@ from .models import Event
 
 def event_list(request):
     """Display a list of events"""
-    events = Event.objects.filter(is_public=True)
+    events = Event.objects.filter(is_public=True).select_related("organizer")
 
     return render(request, "events/event_list.html", {"events": events})
 
 
 def event_detail(request, pk):
     """Display event detail with chat room"""
-    event = get_object_or_404(Event, pk=pk, is_public=True)
+    event = get_object_or_404(
+        Event.objects.select_related("organizer"), pk=pk, is_public=True
+    )
 
     context = {
         "event": event,
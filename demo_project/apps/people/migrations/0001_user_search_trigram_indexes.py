@@ -0,0 +1,35 @@
+from django.db import migrations
+
+# Columns searched with icontains by the people list
+SEARCH_COLUMNS = ["username", "first_name", "last_name", "email"]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    # Trigram indexes only exist on PostgreSQL; SQLite keeps scanning
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in SEARCH_COLUMNS:
+        # Match the UPPER(col::text) LIKE expression Django emits for icontains
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS auth_user_{column}_upper_trgm "
+            f'ON auth_user USING gin (UPPER("{column}"::text) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for column in SEARCH_COLUMNS:
+        schema_editor.execute(f"DROP INDEX IF EXISTS auth_user_{column}_upper_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
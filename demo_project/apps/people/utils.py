@@ -1,3 +1,6 @@
+from functools import lru_cache
+
+
 def get_user_name(user):
     """
     Return user's name formatted as "First Name L."
@@ -11,8 +14,22 @@ def get_user_name(user):
     if not user:
         return ""
 
-    first_name = user.first_name.strip() if user.first_name else ""
-    last_name = user.last_name.strip() if user.last_name else ""
+    return _format_user_name(
+        user.first_name or "", user.last_name or "", user.username
+    )
+
+
+@lru_cache(maxsize=4096)
+def _format_user_name(first_name, last_name, username):
+    """
+    Format a user's name from its parts.
+
+    The result only depends on the arguments, so repeated lookups for the
+    same user (e.g. a sender shown next to many messages) hit the cache,
+    and renaming a user simply produces a new cache key.
+    """
+    first_name = first_name.strip()
+    last_name = last_name.strip()
 
     if first_name and last_name:
         return f"{first_name} {last_name[0]}."
@@ -21,4 +38,4 @@ def get_user_name(user):
     elif last_name:
         return last_name
     else:
-        return user.username
+        return username
@@ -11,8 +11,10 @@ def person_list(request):
     """
     search_query = request.GET.get('search', '')
 
-    # Get active users (is_active=True)
-    users = User.objects.filter(is_active=True)
+    # Get active users (is_active=True), loading only the fields the list shows
+    users = User.objects.filter(is_active=True).only(
+        'id', 'username', 'first_name', 'last_name', 'email', 'date_joined'
+    )
 
     # Apply search filter if provided
     if search_query:
@@ -35,7 +37,7 @@ def person_list(request):
         'page_obj': page_obj,
         'users_with_avatars': page_obj,
         'search_query': search_query,
-        'total_users': users.count(),
+        'total_users': paginator.count,
     }
 
     return render(request, 'people/person_list.html', context)
@@ -5,6 +5,7 @@ from .models import Video
 @admin.register(Video)
 class VideoAdmin(admin.ModelAdmin):
     list_display = ('title', 'uploaded_by', 'is_public', 'created_at', 'duration')
+    list_select_related = ('uploaded_by',)
     list_filter = ('is_public', 'uploaded_by', 'created_at')
     search_fields = ('title', 'description', 'url')
     date_hierarchy = 'created_at'
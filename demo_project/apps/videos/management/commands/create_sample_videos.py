@@ -1,6 +1,9 @@
+from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from django.utils import timezone
 from datetime import timedelta
 import random
@@ -8,6 +11,8 @@ import random
 from demo_project.apps.videos.models import Video
 from django_messaging.models import ChatRoom, ChatMembership
 
+BULK_BATCH_SIZE = settings.SEED_BULK_CREATE_BATCH_SIZE
+
 
 class Command(BaseCommand):
     help = 'Create sample videos and chat rooms for demonstration'
@@ -18,33 +23,53 @@ class Command(BaseCommand):
             action='store_true',
             help='Clear existing sample videos before creating new data',
         )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            help='Seed for the random uploaders and room members, for reproducible data',
+        )
 
+    @transaction.atomic
     def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        video_ct = ContentType.objects.get_for_model(Video)
+
         if options['clear']:
             self.stdout.write('Clearing existing sample videos...')
-            Video.objects.all().delete()
-            # Clear chat rooms that are attached to videos
-            video_ct = ContentType.objects.get_for_model(Video)
+            # Nothing has a foreign key to Video, so skip the deletion collector
+            # and its per-object signals with a single DELETE statement
+            videos = Video.objects.all()
+            videos._raw_delete(videos.db)
+            # Clear chat rooms that are attached to videos; these keep the ORM
+            # delete so memberships and messages are cascaded
             ChatRoom.objects.filter(content_type=video_ct).delete()
 
         # Get or create sample users
-        users = []
-        for i in range(5):
-            username = f'user{i+1}'
-            user, created = User.objects.get_or_create(
+        usernames = [f'user{i+1}' for i in range(5)]
+        users_by_username = User.objects.in_bulk(usernames, field_name='username')
+        missing_users = [
+            (i, username)
+            for i, username in enumerate(usernames, start=1)
+            if username not in users_by_username
+        ]
+        # Only pay for the password hash when there are users to create
+        hashed_password = make_password('password123') if missing_users else None
+        new_users = [
+            User(
                 username=username,
-                defaults={
-                    'first_name': f'User',
-                    'last_name': f'{i+1}',
-                    'email': f'{username}@example.com',
-                    'is_active': True,
-                }
+                first_name='User',
+                last_name=f'{i}',
+                email=f'{username}@example.com',
+                is_active=True,
+                password=hashed_password,
             )
-            if created:
-                user.set_password('password123')
-                user.save()
-                self.stdout.write(f'Created user: {username}')
-            users.append(user)
+            for i, username in missing_users
+        ]
+        User.objects.bulk_create(new_users, batch_size=BULK_BATCH_SIZE)
+        for user in new_users:
+            users_by_username[user.username] = user
+            self.stdout.write(f'Created user: {user.username}')
+        users = [users_by_username[username] for username in usernames]
 
         # Create sample videos
         video_data = [
@@ -92,38 +117,44 @@ class Command(BaseCommand):
             },
         ]
 
-        for video_info in video_data:
-            video, created = Video.objects.get_or_create(
-                title=video_info['title'],
+        existing_titles = set(
+            Video.objects.filter(
+                title__in=[video_info['title'] for video_info in video_data]
+            ).values_list('title', flat=True)
+        )
+        new_videos = Video.objects.bulk_create(
+            [
+                Video(**video_info, uploaded_by=rng.choice(users))
+                for video_info in video_data
+                if video_info['title'] not in existing_titles
+            ],
+            batch_size=BULK_BATCH_SIZE,
+        )
+
+        # Memberships for all new rooms are inserted together at the end
+        memberships = []
+
+        for video in new_videos:
+            self.stdout.write(f'Created video: {video.title}')
+
+            # Create chat room for video
+            room, room_created = ChatRoom.objects.get_or_create(
+                content_type=video_ct,
+                object_id=video.pk,
                 defaults={
-                    **video_info,
-                    'uploaded_by': random.choice(users),
+                    'title': f"Discussion: {video.title}",
+                    'is_room': True,
+                    'is_group': True,
                 }
             )
-            if created:
-                self.stdout.write(f'Created video: {video.title}')
-                
-                # Create chat room for video
-                content_type = ContentType.objects.get_for_model(Video)
-                room, room_created = ChatRoom.objects.get_or_create(
-                    content_type=content_type,
-                    object_id=video.pk,
-                    defaults={
-                        'title': f"Discussion: {video.title}",
-                        'is_room': True,
-                        'is_group': True,
-                    }
+            if room_created:
+                # Add some users to the room
+                user_count = min(rng.randint(2, 4), len(users))
+                memberships.extend(
+                    ChatMembership(chat=room, user=user, role=ChatMembership.Role.MEMBER)
+                    for user in rng.sample(users, user_count)
                 )
-                if room_created:
-                    # Add some users to the room
-                    user_count = min(random.randint(2, 4), len(users))
-                    for user in random.sample(users, user_count):
-                        ChatMembership.objects.get_or_create(
-                            chat=room,
-                            user=user,
-                            defaults={'role': ChatMembership.Role.MEMBER}
-                        )
-                    self.stdout.write(f'Created chat room for video: {video.title}')
+                self.stdout.write(f'Created chat room for video: {video.title}')
 
         # Create some standalone chat rooms for video discussions
         standalone_rooms = [
@@ -146,13 +177,15 @@ class Command(BaseCommand):
                 self.stdout.write(f'Created standalone room: {room.title}')
                 
                 # Add some users to the room
-                room_user_count = min(random.randint(2, 5), len(users))
-                for user in random.sample(users, room_user_count):
-                    ChatMembership.objects.get_or_create(
-                        chat=room,
-                        user=user,
-                        defaults={'role': ChatMembership.Role.MEMBER}
-                    )
+                room_user_count = min(rng.randint(2, 5), len(users))
+                memberships.extend(
+                    ChatMembership(chat=room, user=user, role=ChatMembership.Role.MEMBER)
+                    for user in rng.sample(users, room_user_count)
+                )
+
+        ChatMembership.objects.bulk_create(
+            memberships, batch_size=BULK_BATCH_SIZE, ignore_conflicts=True
+        )
 
         self.stdout.write(
             self.style.SUCCESS('Successfully created sample videos and chat rooms!')
@@ -0,0 +1,19 @@
+# Generated by Django 5.2 on 2026-10-15 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("videos", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="video",
+            index=models.Index(
+                fields=["is_public", "-created_at"], name="video_public_recent_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+import re
+
+from django.db import migrations
+from django.db.models import Q
+
+# Same parsing as Video.get_youtube_video_id; historical models have no methods
+YOUTUBE_ID_RE = re.compile(r"youtube\.com/watch\?v=([^&]*)|youtu\.be/([^?]*)")
+BATCH_SIZE = 500
+
+
+def backfill_video_urls(apps, schema_editor):
+    Video = apps.get_model("videos", "Video")
+    videos = Video.objects.filter(Q(embed_url="") | Q(thumbnail="")).only(
+        "id", "url", "embed_url", "thumbnail"
+    )
+
+    batch = []
+    for video in videos.iterator(chunk_size=BATCH_SIZE):
+        match = YOUTUBE_ID_RE.search(video.url)
+        if not match:
+            continue
+        video_id = match.group(match.lastindex)
+        if not video.embed_url:
+            video.embed_url = f"https://www.youtube.com/embed/{video_id}"
+        if not video.thumbnail and video_id:
+            video.thumbnail = f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
+        batch.append(video)
+        if len(batch) >= BATCH_SIZE:
+            Video.objects.bulk_update(batch, ["embed_url", "thumbnail"])
+            batch = []
+
+    if batch:
+        Video.objects.bulk_update(batch, ["embed_url", "thumbnail"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("videos", "0002_video_video_public_recent_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_video_urls, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-15 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("videos", "0003_backfill_video_embed_and_thumbnail"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="video",
+            name="title",
+            field=models.CharField(max_length=200, unique=True),
+        ),
+    ]
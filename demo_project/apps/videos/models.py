@@ -1,10 +1,40 @@
+import re
+from functools import lru_cache
+
 from django.db import models
 from django.urls import reverse
 from django.contrib.auth.models import User
 
+# Video ID from youtube.com/watch?v=<id> (up to "&") or youtu.be/<id> (up to "?")
+YOUTUBE_ID_RE = re.compile(r"youtube\.com/watch\?v=([^&]*)|youtu\.be/([^?]*)")
+
+
+@lru_cache(maxsize=1024)
+def extract_youtube_id(url):
+    """Return the YouTube video ID in url, or None for non-YouTube URLs"""
+    match = YOUTUBE_ID_RE.search(url)
+    # Only one alternative matches, so its group is the last one set
+    return match.group(match.lastindex) if match else None
+
+
+def youtube_embed_url(url):
+    """Return the YouTube embed URL for url, or None for non-YouTube URLs"""
+    video_id = extract_youtube_id(url)
+    if video_id is not None:
+        return f"https://www.youtube.com/embed/{video_id}"
+    return None
+
+
+def youtube_thumbnail_url(url):
+    """Return the YouTube thumbnail URL for url, or None without a video ID"""
+    video_id = extract_youtube_id(url)
+    if video_id:
+        return f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
+    return None
+
 
 class Video(models.Model):
-    title = models.CharField(max_length=200)
+    title = models.CharField(max_length=200, unique=True)
     description = models.TextField(blank=True)
     url = models.URLField(help_text="YouTube, Vimeo, or other video URL")
     embed_url = models.URLField(blank=True, help_text="YouTube embed URL (e.g., https://www.youtube.com/embed/VIDEO_ID)")
@@ -17,6 +47,10 @@ class Video(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Serves the public video list filtered on is_public, newest first
+            models.Index(fields=['is_public', '-created_at'], name='video_public_recent_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -24,38 +58,69 @@ class Video(models.Model):
     def get_absolute_url(self):
         return reverse('videos:detail', kwargs={'pk': self.pk})
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored URL so save() can tell when it changes
+        instance._loaded_url = instance.__dict__.get('url')
+        return instance
+
+    def save(self, *args, **kwargs):
+        # Store the derived YouTube URLs so templates can read the columns directly
+        update_fields = kwargs.get('update_fields')
+        writes_url = update_fields is None or 'url' in update_fields
+        if writes_url:
+            derived = self._refresh_derived_urls()
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | set(derived)
+        super().save(*args, **kwargs)
+        if writes_url:
+            # Read __dict__ so a deferred url is not loaded just to remember it
+            self._loaded_url = self.__dict__.get('url')
+
+    def _refresh_derived_urls(self):
+        """
+        Re-derive embed_url and thumbnail from the current url.
+
+        Blank fields are filled in. A field that still holds the value derived
+        from the previously saved url follows the url when it changes; any
+        other value is a manual override and is kept.
+
+        Returns:
+            list: Names of the fields that were changed
+        """
+        deferred = self.get_deferred_fields()
+        if 'url' in deferred:
+            return []
+
+        old_url = getattr(self, '_loaded_url', None)
+        url_changed = old_url is not None and old_url != self.url
+        changed = []
+        for field, derive in (('embed_url', youtube_embed_url), ('thumbnail', youtube_thumbnail_url)):
+            if field in deferred:
+                continue
+            value = getattr(self, field)
+            if not value or (url_changed and value == derive(old_url)):
+                new_value = derive(self.url) or ''
+                if new_value != value:
+                    setattr(self, field, new_value)
+                    changed.append(field)
+        return changed
+
     def get_embed_url(self):
         """Generate embed URL from regular YouTube URL"""
         if self.embed_url:
             return self.embed_url
 
-        if 'youtube.com/watch?v=' in self.url:
-            video_id = self.url.split('watch?v=')[1].split('&')[0]
-            return f"https://www.youtube.com/embed/{video_id}"
-        elif 'youtu.be/' in self.url:
-            video_id = self.url.split('youtu.be/')[1].split('?')[0]
-            return f"https://www.youtube.com/embed/{video_id}"
-
-        return None
+        return youtube_embed_url(self.url)
 
     def get_youtube_video_id(self):
         """Extract YouTube video ID from URL"""
-        if 'youtube.com/watch?v=' in self.url:
-            return self.url.split('watch?v=')[1].split('&')[0]
-        elif 'youtu.be/' in self.url:
-            return self.url.split('youtu.be/')[1].split('?')[0]
-        return None
+        return extract_youtube_id(self.url)
 
     def get_thumbnail_url(self):
         """Get thumbnail URL - use custom thumbnail or generate from YouTube"""
         if self.thumbnail:
             return self.thumbnail
 
-        video_id = self.get_youtube_video_id()
-        if video_id:
-            return f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
-
-        return None
-
-
-
+        return youtube_thumbnail_url(self.url)
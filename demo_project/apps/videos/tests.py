@@ -1,3 +1,94 @@
+from django.contrib.auth.models import User
 from django.test import TestCase
 
-# Create your tests here.
+from .models import Video
+
+OLD_URL = "https://www.youtube.com/watch?v=F5mRW0jo-U4"
+NEW_URL = "https://www.youtube.com/watch?v=kqtD5dpn9C8"
+MANUAL_EMBED_URL = "https://player.example.com/embed/1"
+MANUAL_THUMBNAIL = "https://cdn.example.com/thumbnail.jpg"
+
+
+class VideoDerivedUrlsTestCase(TestCase):
+    """Video.save() keeps embed_url and thumbnail in step with url"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="uploader")
+
+    def _create_video(self, **kwargs):
+        return Video.objects.create(title="Test Video", url=OLD_URL, uploaded_by=self.user, **kwargs)
+
+    def test_blank_fields_are_filled(self):
+        video = self._create_video()
+
+        video.refresh_from_db()
+        self.assertEqual(video.embed_url, "https://www.youtube.com/embed/F5mRW0jo-U4")
+        self.assertEqual(video.thumbnail, "https://img.youtube.com/vi/F5mRW0jo-U4/maxresdefault.jpg")
+
+    def test_changed_url_rederives_both_fields(self):
+        self._create_video()
+
+        video = Video.objects.get()
+        video.url = NEW_URL
+        video.save()
+
+        video.refresh_from_db()
+        self.assertEqual(video.embed_url, "https://www.youtube.com/embed/kqtD5dpn9C8")
+        self.assertEqual(video.thumbnail, "https://img.youtube.com/vi/kqtD5dpn9C8/maxresdefault.jpg")
+
+    def test_changed_url_keeps_manual_overrides(self):
+        self._create_video(embed_url=MANUAL_EMBED_URL, thumbnail=MANUAL_THUMBNAIL)
+
+        video = Video.objects.get()
+        video.url = NEW_URL
+        video.save()
+
+        video.refresh_from_db()
+        self.assertEqual(video.embed_url, MANUAL_EMBED_URL)
+        self.assertEqual(video.thumbnail, MANUAL_THUMBNAIL)
+
+    def test_unchanged_url_keeps_manual_override(self):
+        self._create_video()
+
+        video = Video.objects.get()
+        video.embed_url = MANUAL_EMBED_URL
+        video.thumbnail = MANUAL_THUMBNAIL
+        video.save()
+
+        video.refresh_from_db()
+        self.assertEqual(video.embed_url, MANUAL_EMBED_URL)
+        self.assertEqual(video.thumbnail, MANUAL_THUMBNAIL)
+
+    def test_update_fields_without_url_leaves_derived_fields(self):
+        self._create_video()
+
+        video = Video.objects.get()
+        video.url = NEW_URL
+        video.title = "Renamed Video"
+        video.save(update_fields=["title"])
+
+        video.refresh_from_db()
+        self.assertEqual(video.title, "Renamed Video")
+        self.assertEqual(video.url, OLD_URL)
+        self.assertEqual(video.embed_url, "https://www.youtube.com/embed/F5mRW0jo-U4")
+        self.assertEqual(video.thumbnail, "https://img.youtube.com/vi/F5mRW0jo-U4/maxresdefault.jpg")
+
+    def test_update_fields_with_url_writes_derived_fields(self):
+        self._create_video()
+
+        video = Video.objects.get()
+        video.url = NEW_URL
+        video.save(update_fields=["url"])
+
+        video.refresh_from_db()
+        self.assertEqual(video.embed_url, "https://www.youtube.com/embed/kqtD5dpn9C8")
+        self.assertEqual(video.thumbnail, "https://img.youtube.com/vi/kqtD5dpn9C8/maxresdefault.jpg")
+
+    def test_save_does_not_load_deferred_url(self):
+        self._create_video()
+
+        video = Video.objects.only("id", "title").get()
+        video.title = "Renamed Video"
+        with self.assertNumQueries(1):
+            video.save()
@@ -1,19 +1,33 @@
 from django.shortcuts import render, get_object_or_404
 from django.contrib.auth.decorators import login_required
+from django.core.paginator import Paginator
 
 from .models import Video
 
 
 def video_list(request):
-    """Display a list of videos"""
-    videos = Video.objects.filter(is_public=True)
+    """Display a paginated list of videos"""
+    videos = (
+        Video.objects.filter(is_public=True)
+        .only("id", "title", "description", "thumbnail", "created_at", "updated_at", "uploaded_by")
+        .select_related("uploaded_by")
+    )
 
-    return render(request, "videos/video_list.html", {"videos": videos})
+    paginator = Paginator(videos, 24)  # Show 24 videos per page
+    page_obj = paginator.get_page(request.GET.get("page"))
+
+    context = {
+        "videos": page_obj,
+        "page_obj": page_obj,
+    }
+    return render(request, "videos/video_list.html", context)
 
 
 def video_detail(request, pk):
     """Display video detail with chat room"""
-    video = get_object_or_404(Video, pk=pk, is_public=True)
+    video = get_object_or_404(
+        Video.objects.select_related("uploaded_by"), pk=pk, is_public=True
+    )
 
     context = {
         "video": video,
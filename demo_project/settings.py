@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -162,6 +163,12 @@ INTERNAL_IPS = [
 CRISPY_ALLOWED_TEMPLATE_PACKS = "tailwind"
 CRISPY_TEMPLATE_PACK = "tailwind"
 
+# Seed data configuration
+# Upper bound on rows per INSERT for bulk_create() calls in the seed commands
+SEED_BULK_CREATE_BATCH_SIZE = int(
+    os.environ.get("DJANGO_SEED_BULK_CREATE_BATCH_SIZE", "500")
+)
+
 # Auth configuration
 LOGIN_REDIRECT_URL = "home"
 LOGOUT_REDIRECT_URL = "home"
@@ -10,13 +10,110 @@ To run polling tests:
 
 To run WebSocket tests:
     pytest demo_project/tests/ -v -m "frontend and websocket"
+
+Tests that launch Chromium through browser_launch_options() or
+shared_browser() (the DM tests and the polling messages page test) run
+headless by default. To watch one in visible windows with slowed-down
+actions, set HEADED=1:
+    HEADED=1 pytest demo_project/tests/test_dm_frontend_polling.py -v -s
+
+PW_SLOW_MO sets their delay between actions in milliseconds (default: 500
+when headed, 0 otherwise). The room tests and the WebSocket messages page
+test launch their own headed browsers and ignore both variables.
 """
 
+import asyncio
 import pytest
 import os
+from urllib.parse import urlparse
+from playwright.async_api import async_playwright
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "demo_project.settings")
 
+# Show browser windows and slow down actions for debugging
+HEADED = os.environ.get("HEADED") == "1"
+SLOW_MO = int(os.environ.get("PW_SLOW_MO", 500 if HEADED else 0))
+
+
+def browser_launch_options():
+    """Chromium launch options: headless by default, headed with slow motion if HEADED=1"""
+    return {"headless": not HEADED, "slow_mo": SLOW_MO}
+
+
+def logged_in_storage_state(user, live_server_url):
+    """
+    Log a user in server-side and return a Playwright storage state for them.
+
+    Pass the result as storage_state= to browser.new_context() to start a
+    context already logged in, without going through the login form.
+
+    Args:
+        user: Django User to log in
+        live_server_url: URL of the live server the browser will visit
+
+    Returns:
+        dict: Storage state holding the user's session cookie
+    """
+    from django.conf import settings
+    from django.test import Client
+
+    client = Client()
+    client.force_login(user)
+    return {
+        "cookies": [
+            {
+                "name": settings.SESSION_COOKIE_NAME,
+                "value": client.cookies[settings.SESSION_COOKIE_NAME].value,
+                "domain": urlparse(live_server_url).hostname,
+                "path": "/",
+                "expires": -1,
+                "httpOnly": True,
+                "secure": False,
+                "sameSite": "Lax",
+            }
+        ],
+        "origins": [],
+    }
+
+
+# (event loop, Playwright, browser) shared by the whole session, once launched
+_shared_browser = None
+
+
+def shared_browser():
+    """
+    Return the event loop and Chromium browser shared by the test session.
+
+    The browser is launched on first use and closed by the
+    close_shared_browser fixture when the session ends. Playwright objects
+    are bound to the event loop that created them, so callers must run
+    their coroutines on the returned loop.
+
+    Returns:
+        tuple: (event loop, Playwright browser)
+    """
+    global _shared_browser
+    if _shared_browser is None:
+        loop = asyncio.new_event_loop()
+        playwright = loop.run_until_complete(async_playwright().start())
+        browser = loop.run_until_complete(
+            playwright.chromium.launch(**browser_launch_options())
+        )
+        _shared_browser = (loop, playwright, browser)
+    loop, _, browser = _shared_browser
+    return loop, browser
+
+
+@pytest.fixture(scope="session", autouse=True)
+def close_shared_browser():
+    """Close the shared browser, if a test launched it, after the session"""
+    yield
+    if _shared_browser is not None:
+        loop, playwright, browser = _shared_browser
+        loop.run_until_complete(browser.close())
+        loop.run_until_complete(playwright.stop())
+        loop.close()
+
 
 @pytest.fixture(autouse=True)
 def enable_db_access_for_all_tests(db):
@@ -53,6 +150,34 @@ def setup_test_database():
     settings.DATABASES["default"]["NAME"] = "test_db.sqlite3"
 
 
+# Resource types the frontend tests never assert on
+DECORATIVE_RESOURCE_TYPES = {"font", "image", "media"}
+
+
+async def block_decorative_assets(context):
+    """
+    Abort font, image and media requests made by pages in a browser context.
+
+    Stylesheets and scripts (including the Tailwind CDN that the visibility
+    checks rely on) still load, as do django_messaging's own static assets.
+
+    Args:
+        context: Playwright browser context
+    """
+
+    async def handle(route):
+        request = route.request
+        if (
+            request.resource_type in DECORATIVE_RESOURCE_TYPES
+            and "/static/django_messaging/" not in request.url
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await context.route("**/*", handle)
+
+
 async def position_browser_windows_side_by_side(
     left_page, right_page, screen_width=1792, screen_height=950
 ):
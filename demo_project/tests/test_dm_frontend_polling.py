@@ -14,20 +14,97 @@ Tests cover:
 
 import asyncio
 import pytest
-from playwright.async_api import async_playwright, expect
+from asgiref.sync import sync_to_async
+from playwright.async_api import expect
 from django.contrib.auth import get_user_model
 from django.contrib.staticfiles.testing import StaticLiveServerTestCase
 from django.test import override_settings
 from django.urls import reverse
-from .conftest import position_browser_windows_side_by_side
+from .conftest import (
+    HEADED,
+    block_decorative_assets,
+    position_browser_windows_side_by_side,
+    shared_browser,
+)
 
 User = get_user_model()
 
 
+def console_logger(label):
+    """
+    Build a console listener that prints browser messages.
+
+    Headless runs only print errors and warnings; the polling transport logs
+    on every request, and echoing all of it slows the test down.
+    """
+
+    def log(msg):
+        if HEADED or msg.type in ("error", "warning"):
+            print(f"[{label} CONSOLE] {msg.type}: {msg.text}")
+
+    return log
+
+
+# Message lists of the DM widget and of the messages page
+WIDGET_MESSAGE_LIST = "#widget-message-list"
+MESSAGE_LIST = "#message-list"
+
+# Click the visible emoji button of a message element (one container has
+# display:none, the other has display:flex; offsetParent !== null means it's rendered)
+CLICK_EMOJI_BUTTON_JS = """msg => {
+    for (const btn of msg.querySelectorAll('.emoji-btn')) {
+        if (btn.offsetParent !== null) {
+            btn.click();
+            return true;
+        }
+    }
+    return false;
+}"""
+
+# Open the context menu of a message element and click one of its actions
+CONTEXT_MENU_ACTION_JS = """(msg, action) => {
+    // Find and click the visible context menu button
+    let contextMenuBtn = null;
+    for (const btn of msg.querySelectorAll('.context-menu-btn')) {
+        if (btn.offsetParent !== null) {
+            contextMenuBtn = btn;
+            break;
+        }
+    }
+
+    if (!contextMenuBtn) {
+        return {success: false, error: 'Context menu button not found or not visible'};
+    }
+
+    // Click to open context menu
+    contextMenuBtn.click();
+
+    // Find the context menu (it's a sibling of the button)
+    const contextMenu = contextMenuBtn.parentElement.querySelector('.context-menu');
+    if (!contextMenu) {
+        return {success: false, error: 'Context menu element not found'};
+    }
+
+    // Remove hidden class to show menu
+    contextMenu.classList.remove('hidden');
+
+    // Find and click the action button
+    const actionBtn = contextMenu.querySelector(action);
+    if (!actionBtn) {
+        return {success: false, error: `${action} not found in context menu`};
+    }
+
+    actionBtn.click();
+    return {success: true};
+}"""
+
+
 @pytest.mark.frontend
 @pytest.mark.slow
 @pytest.mark.polling
 @override_settings(
+    # PBKDF2 costs ~100ms per hash; both user creation and login hash the password
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"],
     DJANGO_MESSAGING={
         "BASE_TEMPLATE": "base.html",
         "TOP_NAVIGATION_HEIGHT": "72px",
@@ -38,262 +115,368 @@ User = get_user_model()
 class DMFrontendTestCase(StaticLiveServerTestCase):
     """Test DM functionality with Playwright using two browser contexts"""
 
+    # Interval of the django_messaging polling transport; cross-browser waits
+    # are derived from it so they can be tuned in one place
+    POLL_INTERVAL_MS = 3000
+
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
-        # Create test users
-        cls.sender = User.objects.create_user(
+        # Resolve the URLs once for all test methods
+        cls.login_url = f"{cls.live_server_url}{reverse('login')}"
+        cls.messages_url = f"{cls.live_server_url}{reverse('django_messaging:messaging-view')}"
+
+        # Reuse the session's browser; its Playwright objects are bound to the
+        # event loop that launched it, so tests run their coroutines on it
+        cls._loop, cls._browser = shared_browser()
+
+    def setUp(self):
+        # Create test users per test; the live server test case flushes the
+        # database after every test method
+        self.sender = User.objects.create_user(
             username="sender_user",
             password="testpass123",
             email="sender@test.com",
             first_name="Sender",
             last_name="User"
         )
-        cls.receiver = User.objects.create_user(
+        self.receiver = User.objects.create_user(
             username="receiver_user",
             password="testpass123",
             email="receiver@test.com",
             first_name="Receiver",
             last_name="User"
         )
+        person_detail_url = reverse('people:person_detail', kwargs={'user_id': self.receiver.id})
+        self.receiver_profile_url = f"{self.live_server_url}{person_detail_url}"
+
+    def test_dm_send_and_receive(self):
+        """Test starting a DM and exchanging messages in real-time"""
+        self._run_scenario(self._scenario_send_and_receive)
+
+    def test_dm_reactions(self):
+        """Test adding and removing reactions in real-time"""
+        self._seed_conversation()
+        self._run_scenario(self._scenario_reactions)
+
+    def test_dm_edits(self):
+        """Test editing messages in real-time"""
+        self._seed_conversation()
+        self._run_scenario(self._scenario_edits)
+
+    def test_dm_deletes(self):
+        """Test deleting messages in real-time"""
+        self._seed_conversation()
+        self._run_scenario(self._scenario_deletes)
+
+    def _seed_conversation(self):
+        """Create a DM between sender and receiver with one message from each"""
+        # Import models here to avoid import issues
+        from django_messaging.models import ChatRoom, ChatMembership, Message
+
+        chat = ChatRoom.objects.create(title="", is_group=False, is_room=False)
+        ChatMembership.objects.bulk_create([
+            ChatMembership(chat=chat, user=self.sender, role=ChatMembership.Role.ADMIN),
+            ChatMembership(chat=chat, user=self.receiver, role=ChatMembership.Role.MEMBER),
+        ])
+        Message.objects.bulk_create([
+            Message(chat=chat, sender=self.sender, content="Hello from sender!"),
+            Message(chat=chat, sender=self.receiver, content="Hello from receiver!"),
+        ])
+
+    def _run_scenario(self, scenario):
+        """Run an async scenario with logged-in sender and receiver pages"""
+        self._loop.run_until_complete(self._run_in_browsers(scenario))
+
+    async def _run_in_browsers(self, scenario):
+        """Set up one browser context per user, run the scenario and clean up"""
+        # Create separate (incognito-like) contexts for sender and receiver
+        sender_context, receiver_context = await asyncio.gather(
+            self._browser.new_context(), self._browser.new_context()
+        )
+        # Skip fonts, images and media the assertions don't depend on
+        await asyncio.gather(
+            block_decorative_assets(sender_context),
+            block_decorative_assets(receiver_context),
+        )
+        sender_page, receiver_page = await asyncio.gather(
+            sender_context.new_page(), receiver_context.new_page()
+        )
 
-    def test_dm_real_time_messaging(self):
-        """Test complete DM workflow with real-time updates"""
-        asyncio.run(self._test_dm_real_time_messaging())
+        # Add console message listeners for debugging
+        receiver_page.on("console", console_logger("RECEIVER"))
+        sender_page.on("console", console_logger("SENDER"))
 
-    async def _test_dm_real_time_messaging(self):
-        """Async test for DM real-time messaging"""
-        async with async_playwright() as p:
-            # Launch browser in headed mode with slow motion for visibility
-            browser = await p.chromium.launch(headless=False, slow_mo=500)
+        if HEADED:
+            # Position windows side by side
+            await position_browser_windows_side_by_side(sender_page, receiver_page)
 
-            # Create normal context for sender
-            sender_context = await browser.new_context()
-            sender_page = await sender_context.new_page()
+        try:
+            # Login sender and receiver; the contexts share no state
+            await asyncio.gather(
+                self._login(sender_page, "sender_user", "testpass123"),
+                self._login(receiver_page, "receiver_user", "testpass123"),
+            )
+            await scenario(sender_page, receiver_page)
+
+        finally:
+            # Cleanup
+            await sender_context.close()
+            await receiver_context.close()
+
+    async def _open_conversation(self, sender_page, receiver_page):
+        """Open the messages page for the receiver and the DM widget for the sender"""
+        # Navigate receiver to messages page
+        # goto() returns after the load event; networkidle would also wait
+        # for a quiet gap between polling requests
+        await receiver_page.goto(self.messages_url)
+
+        # Block until the chat app is up on the polling transport
+        await receiver_page.wait_for_function(
+            "() => window.chatApp?.wsTransport?.constructor?.name === 'PollingTransport'",
+            timeout=10000,
+        )
 
-            # Create incognito context for receiver
-            receiver_context = await browser.new_context()
-            receiver_page = await receiver_context.new_page()
+        # Navigate sender to receiver's profile page
+        await sender_page.goto(self.receiver_profile_url)
+
+        # Open DM widget on sender's page
+        chat_toggle_btn = sender_page.locator("#chat-toggle-btn")
+        await expect(chat_toggle_btn).to_be_visible(timeout=10000)
+        await chat_toggle_btn.click()
+
+        # Wait for widget to be visible
+        widget = sender_page.locator("#fixed-chat-widget")
+        await expect(widget).to_be_visible()
+
+    async def _select_chat_in_messages_page(self, receiver_page, timeout=10000):
+        """Select the DM with the sender in the receiver's chat list"""
+        # Wait for chat to appear in chat list
+        # Use just first name since that's what appears in the chat item
+        sender_name = self.sender.first_name
+        chat_item = receiver_page.locator(".chat-item").filter(has_text=sender_name)
+
+        await expect(chat_item).to_be_visible(timeout=timeout)
+
+        # Click on the chat to open it
+        await chat_item.click()
+
+        # Wait for message list to be visible (use ID selector)
+        message_list = receiver_page.locator(MESSAGE_LIST)
+        await expect(message_list).to_be_visible(timeout=10000)
+        return message_list
+
+    async def _open_seeded_conversation(self, sender_page, receiver_page):
+        """Open the seeded DM on both sides and wait for its messages"""
+        await self._open_conversation(sender_page, receiver_page)
+        # The seeded chat is part of the initial page render, so there is no
+        # polling cycle to wait for
+        message_list = await self._select_chat_in_messages_page(receiver_page)
+        await expect(
+            message_list.get_by_text("Hello from receiver!")
+        ).to_be_visible(timeout=10000)
+        await expect(
+            sender_page.locator(WIDGET_MESSAGE_LIST).get_by_text("Hello from receiver!")
+        ).to_be_visible(timeout=10000)
+
+    async def _scenario_send_and_receive(self, sender_page, receiver_page):
+        """Sender starts a DM from the profile page and both sides exchange messages"""
+        await self._open_conversation(sender_page, receiver_page)
+
+        # Test 1: Send a message from sender
+        print("📤 Test 1: Sending message from sender...")
+        await self._send_message_in_widget(sender_page, "Hello from sender!")
+
+        # Verify message appears in sender's widget
+        await expect(
+            sender_page.locator(WIDGET_MESSAGE_LIST).get_by_text("Hello from sender!")
+        ).to_be_visible(timeout=10000)
+
+        # Test 2: Receiver sees new chat appear and selects it
+        print("📥 Test 2: Receiver sees new chat and selects it...")
+        # Check the backend first, so a missing chat fails here rather than
+        # as a polling timeout in the receiver's browser
+        chat_exists = await sync_to_async(self._receiver_has_message)("Hello from sender!")
+        self.assertTrue(chat_exists, "Sender's message was not stored in a chat with the receiver")
+
+        print(f"⏳ Waiting for polling to fetch new chat (polling interval is {self.POLL_INTERVAL_MS / 1000:g}s)...")
+        # The chat is already stored, so it shows up on the next poll
+        message_list = await self._select_chat_in_messages_page(
+            receiver_page, timeout=self.POLL_INTERVAL_MS * 3
+        )
 
-            # Add console message listeners for debugging
-            receiver_page.on("console", lambda msg: print(f"[RECEIVER CONSOLE] {msg.type}: {msg.text}"))
-            sender_page.on("console", lambda msg: print(f"[SENDER CONSOLE] {msg.type}: {msg.text}"))
+        # Verify receiver sees the message
+        print("📥 Verifying receiver sees message...")
+        await expect(
+            message_list.get_by_text("Hello from sender!")
+        ).to_be_visible(timeout=10000)
+
+        # Test 3: Receiver sends a reply
+        print("📤 Test 3: Receiver sends reply...")
+        await self._send_message_in_messages_page(receiver_page, "Hello from receiver!")
+
+        # Verify sender receives the reply in real-time
+        print("📥 Verifying sender receives reply in real-time...")
+        await expect(
+            sender_page.locator(WIDGET_MESSAGE_LIST).get_by_text("Hello from receiver!")
+        ).to_be_visible(timeout=10000)
+
+        print("✅ DM send and receive tests passed!")
+
+    async def _scenario_reactions(self, sender_page, receiver_page):
+        """Both sides add and remove reactions on the seeded messages"""
+        await self._open_seeded_conversation(sender_page, receiver_page)
+        receiver_message = receiver_page.locator(f"{MESSAGE_LIST} [data-message-id]").filter(has_text="Hello from receiver!")
+        sender_message = sender_page.locator(f"{WIDGET_MESSAGE_LIST} [data-message-id]").filter(has_text="Hello from sender!")
+
+        # The two sides react to different messages, so each pair of actions
+        # and each pair of cross-party checks runs concurrently
+
+        # Test 4: Sender adds a reaction to receiver's message
+        # Test 6: Receiver adds a reaction to sender's message
+        print("👍 Test 4 / ❤️ Test 6: Sender and receiver add reactions...")
+        await asyncio.gather(
+            self._add_reaction(sender_page, WIDGET_MESSAGE_LIST, "Hello from receiver!", "👍"),
+            self._add_reaction(receiver_page, MESSAGE_LIST, "Hello from sender!", "❤️"),
+        )
 
-            # Position windows side by side
-            await position_browser_windows_side_by_side(sender_page, receiver_page)
+        # Test 5: Verify receiver sees the reaction in real-time
+        # Test 7: Verify sender sees the reaction in real-time
+        print("📥 Test 5 / Test 7: Verifying both sides see the reactions in real-time...")
+        await asyncio.gather(
+            expect(receiver_message.locator(".reaction").filter(has_text="👍")).to_be_visible(timeout=15000),
+            expect(sender_message.locator(".reaction").filter(has_text="❤️")).to_be_visible(timeout=15000),
+        )
+
+        # Test 8: Sender removes their reaction
+        # Test 10: Receiver removes their reaction
+        print("🗑️ Test 8 / Test 10: Sender and receiver remove reactions...")
+        await asyncio.gather(
+            self._remove_reaction(sender_page, WIDGET_MESSAGE_LIST, "Hello from receiver!", "👍"),
+            self._remove_reaction(receiver_page, MESSAGE_LIST, "Hello from sender!", "❤️"),
+        )
+
+        # Test 9: Verify receiver sees reaction removed in real-time
+        # Test 11: Verify sender sees reaction removed in real-time
+        print("📥 Test 9 / Test 11: Verifying both sides see the reactions removed...")
+        await asyncio.gather(
+            expect(receiver_message.locator(".reaction").filter(has_text="👍")).not_to_be_visible(timeout=15000),
+            expect(sender_message.locator(".reaction").filter(has_text="❤️")).not_to_be_visible(timeout=15000),
+        )
+
+        print("✅ DM reaction tests passed!")
+
+    async def _scenario_edits(self, sender_page, receiver_page):
+        """Both sides edit their seeded messages"""
+        await self._open_seeded_conversation(sender_page, receiver_page)
+
+        # Test 12: Sender edits their message
+        # Test 14: Receiver edits their message
+        print("✏️ Test 12 / Test 14: Sender and receiver edit messages...")
+        await asyncio.gather(
+            self._edit_message_in_widget(sender_page, "Hello from sender!", "Hello from sender (edited)!"),
+            self._edit_message_in_messages_page(receiver_page, "Hello from receiver!", "Hello from receiver (edited)!"),
+        )
+
+        # Test 13: Verify receiver sees the edited message in real-time
+        # Test 15: Verify sender sees the edited message in real-time
+        print("📥 Test 13 / Test 15: Verifying both sides see the edited messages...")
+        await asyncio.gather(
+            self._assert_edited(receiver_page, MESSAGE_LIST, "Hello from sender (edited)!"),
+            self._assert_edited(sender_page, WIDGET_MESSAGE_LIST, "Hello from receiver (edited)!"),
+        )
+
+        print("✅ DM edit tests passed!")
 
-            try:
-                # Login sender
-                await self._login(sender_page, "sender_user", "testpass123")
-
-                # Login receiver
-                await self._login(receiver_page, "receiver_user", "testpass123")
-
-                # Navigate receiver to messages page
-                messages_url = reverse('django_messaging:messaging-view')
-                await receiver_page.goto(f"{self.live_server_url}{messages_url}")
-                await receiver_page.wait_for_load_state("networkidle")
-
-                # Verify polling transport is loaded
-                transport_check = await receiver_page.evaluate("""
-                    () => {
-                        return {
-                            hasPollingTransport: typeof PollingTransport !== 'undefined',
-                            hasWebSocketTransport: typeof WebSocketTransport !== 'undefined',
-                            transportType: window.chatApp?.wsTransport?.constructor?.name || 'unknown'
-                        };
-                    }
-                """)
-                print(f"🔍 Transport check: {transport_check}")
-                if not transport_check['hasPollingTransport']:
-                    print("⚠️ WARNING: PollingTransport not loaded!")
-                if transport_check['transportType'] != 'PollingTransport':
-                    print(f"⚠️ WARNING: Using {transport_check['transportType']} instead of PollingTransport!")
-
-                # Navigate sender to receiver's profile page
-                person_detail_url = reverse('people:person_detail', kwargs={'user_id': self.receiver.id})
-                await sender_page.goto(f"{self.live_server_url}{person_detail_url}")
-                await sender_page.wait_for_load_state("networkidle")
-                await asyncio.sleep(1)
-
-                # Open DM widget on sender's page
-                chat_toggle_btn = sender_page.locator("#chat-toggle-btn")
-                await expect(chat_toggle_btn).to_be_visible()
-                await chat_toggle_btn.click()
-
-                # Wait for widget to be visible
-                widget = sender_page.locator("#fixed-chat-widget")
-                await expect(widget).to_be_visible()
-
-                # Test 1: Send a message from sender
-                print("📤 Test 1: Sending message from sender...")
-                await self._send_message_in_widget(sender_page, "Hello from sender!")
-                await asyncio.sleep(2)  # Wait for message to be sent and saved
-
-                # Verify message appears in sender's widget
-                await expect(
-                    sender_page.locator("#widget-message-list").get_by_text("Hello from sender!")
-                ).to_be_visible(timeout=10000)
-
-                # Test 2: Receiver sees new chat appear and selects it
-                print("📥 Test 2: Receiver sees new chat and selects it...")
-                print("⏳ Waiting for polling to fetch new chat (polling interval is 3s)...")
-
-                # Wait for at least one polling cycle (3 seconds) plus some buffer
-                await asyncio.sleep(4)
-
-                # Wait for chat to appear in chat list
-                # Use just first name since that's what appears in the chat item
-                sender_name = self.sender.first_name
-                chat_item = receiver_page.locator(".chat-item").filter(has_text=sender_name)
-
-                # Try to find the chat, if not found, wait for next polling cycle
-                try:
-                    await expect(chat_item).to_be_visible(timeout=8000)  # Wait up to 8 more seconds
-                except Exception as e:
-                    print(f"⚠️ Chat not visible yet, waiting for next polling cycle...")
-                    await asyncio.sleep(3)  # Wait for another polling cycle
-                    await expect(chat_item).to_be_visible(timeout=10000)
-
-                # Click on the chat to open it
-                await chat_item.click()
-                await asyncio.sleep(2)  # Wait for chat to load
-
-                # Wait for message list to be visible (use ID selector)
-                message_list = receiver_page.locator("#message-list")
-                await expect(message_list).to_be_visible(timeout=10000)
-
-                # Verify receiver sees the message
-                print("📥 Verifying receiver sees message...")
-                await expect(
-                    message_list.get_by_text("Hello from sender!")
-                ).to_be_visible(timeout=10000)
-
-                # Test 3: Receiver sends a reply
-                print("📤 Test 3: Receiver sends reply...")
-                await self._send_message_in_messages_page(receiver_page, "Hello from receiver!")
-
-                # Verify sender receives the reply in real-time
-                print("📥 Verifying sender receives reply in real-time...")
-                await expect(
-                    sender_page.locator("#widget-message-list").get_by_text("Hello from receiver!")
-                ).to_be_visible(timeout=10000)
-
-                # Test 4: Sender adds a reaction to receiver's message
-                print("👍 Test 4: Sender adds reaction...")
-                await self._add_reaction_in_widget(sender_page, "Hello from receiver!", "👍")
-
-                # Test 5: Verify receiver sees the reaction in real-time
-                print("📥 Test 5: Verifying receiver sees reaction in real-time...")
-                receiver_message = receiver_page.locator("#message-list [data-message-id]").filter(has_text="Hello from receiver!")
-                await expect(receiver_message.locator(".reaction").filter(has_text="👍")).to_be_visible(timeout=15000)
-
-                # Test 6: Receiver adds a reaction to sender's message
-                print("❤️ Test 6: Receiver adds reaction...")
-                await self._add_reaction_in_messages_page(receiver_page, "Hello from sender!", "❤️")
-
-                # Test 7: Verify sender sees the reaction in real-time
-                print("📥 Test 7: Verifying sender sees reaction in real-time...")
-                sender_message = sender_page.locator("#widget-message-list [data-message-id]").filter(has_text="Hello from sender!")
-                await expect(sender_message.locator(".reaction").filter(has_text="❤️")).to_be_visible(timeout=15000)
-
-                # Test 8: Sender removes their reaction
-                print("🗑️ Test 8: Sender removes reaction...")
-                await self._remove_reaction_in_widget(sender_page, "Hello from receiver!", "👍")
-
-                # Test 9: Verify receiver sees reaction removed in real-time
-                print("📥 Test 9: Verifying receiver sees reaction removed...")
-                receiver_message = receiver_page.locator("#message-list [data-message-id]").filter(has_text="Hello from receiver!")
-                await expect(receiver_message.locator(".reaction").filter(has_text="👍")).not_to_be_visible(timeout=15000)
-
-                # Test 10: Receiver removes their reaction
-                print("🗑️ Test 10: Receiver removes reaction...")
-                await self._remove_reaction_in_messages_page(receiver_page, "Hello from sender!", "❤️")
-
-                # Test 11: Verify sender sees reaction removed in real-time
-                print("📥 Test 11: Verifying sender sees reaction removed...")
-                sender_message = sender_page.locator("#widget-message-list [data-message-id]").filter(has_text="Hello from sender!")
-                await expect(sender_message.locator(".reaction").filter(has_text="❤️")).not_to_be_visible(timeout=15000)
-
-                # Test 12: Sender edits their message
-                print("✏️ Test 12: Sender edits message...")
-                await self._edit_message_in_widget(sender_page, "Hello from sender!", "Hello from sender (edited)!")
-
-                # Test 13: Verify receiver sees the edited message in real-time
-                print("📥 Test 13: Verifying receiver sees edited message...")
-                await expect(
-                    receiver_page.locator("#message-list").get_by_text("Hello from sender (edited)!")
-                ).to_be_visible(timeout=10000)
-                # Click message bubble to show timestamp with edited indicator
-                edited_message = receiver_page.locator("#message-list [data-message-id]").filter(has_text="Hello from sender (edited)!")
-                await edited_message.locator(".message-bubble").click()
-                await asyncio.sleep(0.3)  # Wait for timestamp to appear
-                timestamp = edited_message.locator(".message-timestamp")
-                await expect(timestamp).to_be_visible()
-                await expect(timestamp).to_contain_text("Edited")
-
-                # Test 14: Receiver edits their message
-                print("✏️ Test 14: Receiver edits message...")
-                await self._edit_message_in_messages_page(receiver_page, "Hello from receiver!", "Hello from receiver (edited)!")
-
-                # Test 15: Verify sender sees the edited message in real-time
-                print("📥 Test 15: Verifying sender sees edited message...")
-                await expect(
-                    sender_page.locator("#widget-message-list").get_by_text("Hello from receiver (edited)!")
-                ).to_be_visible(timeout=10000)
-                # Click message bubble to show timestamp with edited indicator
-                edited_message_widget = sender_page.locator("#widget-message-list [data-message-id]").filter(has_text="Hello from receiver (edited)!")
-                await edited_message_widget.locator(".message-bubble").click()
-                await asyncio.sleep(0.3)  # Wait for timestamp to appear
-                timestamp_widget = edited_message_widget.locator(".message-timestamp")
-                await expect(timestamp_widget).to_be_visible()
-                await expect(timestamp_widget).to_contain_text("Edited")
-
-                # Test 16: Sender deletes their message
-                print("🗑️ Test 16: Sender deletes message...")
-                await self._delete_message_in_widget(sender_page, "Hello from sender (edited)!")
-
-                # Test 17: Verify receiver sees the deleted message in real-time
-                print("📥 Test 17: Verifying receiver sees deleted message...")
-                await asyncio.sleep(4)  # Wait for polling to detect the deletion
-                await expect(
-                    receiver_page.locator(".deleted-indicator").first
-                ).to_be_visible(timeout=10000)
-
-                # Test 18: Receiver deletes their message
-                print("🗑️ Test 18: Receiver deletes message...")
-                await self._delete_message_in_messages_page(receiver_page, "Hello from receiver (edited)!")
-
-                # Test 19: Verify sender sees the deleted message in real-time
-                print("📥 Test 19: Verifying sender sees deleted message...")
-                await asyncio.sleep(4)  # Wait for polling to detect the deletion
-                await expect(
-                    sender_page.locator(".deleted-indicator").first
-                ).to_be_visible(timeout=10000)
-
-                print("✅ All DM frontend tests passed!")
-
-            finally:
-                # Cleanup
-                await sender_context.close()
-                await receiver_context.close()
-                await browser.close()
+    async def _scenario_deletes(self, sender_page, receiver_page):
+        """Both sides delete their seeded messages"""
+        await self._open_seeded_conversation(sender_page, receiver_page)
+
+        # Test 16: Sender deletes their message
+        # Test 18: Receiver deletes their message
+        # Note the ids of the messages each side will see the other delete
+        sender_message_id, receiver_message_id = await asyncio.gather(
+            self._message_id(receiver_page, MESSAGE_LIST, "Hello from sender!"),
+            self._message_id(sender_page, WIDGET_MESSAGE_LIST, "Hello from receiver!"),
+        )
+
+        print("🗑️ Test 16 / Test 18: Sender and receiver delete messages...")
+        await asyncio.gather(
+            self._delete_message(sender_page, WIDGET_MESSAGE_LIST, "Hello from sender!"),
+            self._delete_message(receiver_page, MESSAGE_LIST, "Hello from receiver!"),
+        )
+
+        # Test 17: Verify receiver sees the deleted message in real-time
+        # Test 19: Verify sender sees the deleted message in real-time
+        # Each side already shows its own deletion, so check the other side's text
+        print("📥 Test 17 / Test 19: Verifying both sides see the deleted messages...")
+        await asyncio.gather(
+            expect(
+                receiver_page.locator(MESSAGE_LIST).get_by_text("Hello from sender!")
+            ).to_have_count(0, timeout=10000),
+            expect(
+                sender_page.locator(WIDGET_MESSAGE_LIST).get_by_text("Hello from receiver!")
+            ).to_have_count(0, timeout=10000),
+        )
+        # Each side also shows an indicator for its own deletion, so look for
+        # the indicator on the other side's message only
+        await asyncio.gather(
+            expect(
+                receiver_page.locator(f'{MESSAGE_LIST} [data-message-id="{sender_message_id}"] .deleted-indicator')
+            ).to_be_visible(),
+            expect(
+                sender_page.locator(f'{WIDGET_MESSAGE_LIST} [data-message-id="{receiver_message_id}"] .deleted-indicator')
+            ).to_be_visible(),
+        )
+
+        print("✅ DM delete tests passed!")
+
+    async def _message_id(self, page, message_list, message_text):
+        """Helper to look up the data-message-id of a message by its text"""
+        message = page.locator(f"{message_list} [data-message-id]").filter(has_text=message_text)
+        return await message.get_attribute("data-message-id")
+
+    def _receiver_has_message(self, content):
+        """Check whether a chat the receiver belongs to contains the given message"""
+        # Import models here to avoid import issues
+        from django_messaging.models import Message
+
+        return Message.objects.filter(chat__members=self.receiver, content=content).exists()
+
+    async def _assert_edited(self, page, message_list, new_text):
+        """Helper to check that a message shows its new text and the edited indicator"""
+        await expect(
+            page.locator(message_list).get_by_text(new_text)
+        ).to_be_visible(timeout=10000)
+        # Click message bubble to show timestamp with edited indicator
+        edited_message = page.locator(f"{message_list} [data-message-id]").filter(has_text=new_text)
+        await edited_message.locator(".message-bubble").click()
+        timestamp = edited_message.locator(".message-timestamp")
+        await expect(timestamp).to_be_visible()
+        await expect(timestamp).to_contain_text("Edited")
 
     async def _login(self, page, username, password):
         """Helper to login a user"""
-        login_url = reverse('login')
-        await page.goto(f"{self.live_server_url}{login_url}")
+        await page.goto(self.login_url)
         await page.fill('input[name="username"]', username)
         await page.fill('input[name="password"]', password)
-        await page.click('button[type="submit"]')
-        await page.wait_for_load_state("networkidle")
+        # Wait for the post-login redirect to be parsed, not for the network to idle
+        async with page.expect_navigation(wait_until="domcontentloaded"):
+            await page.click('button[type="submit"]')
+
+    async def _wait_until(self, page, js_predicate, arg=None, timeout=10000):
+        """Helper to wait until a JS predicate is truthy in the page"""
+        await page.wait_for_function(js_predicate, arg=arg, timeout=timeout)
 
     async def _send_message_in_widget(self, page, message_text):
         """Helper to send a message in the DM widget"""
         message_input = page.locator("#widget-message-input")
         await message_input.fill(message_text)
         await message_input.press("Enter")
-        await asyncio.sleep(1)
+        # The widget clears the input once the message has been sent
+        await self._wait_until(
+            page, "el => el.value === ''", arg=await message_input.element_handle()
+        )
 
     async def _send_message_in_messages_page(self, page, message_text):
         """Helper to send a message in the messages page"""
@@ -301,294 +484,79 @@ class DMFrontendTestCase(StaticLiveServerTestCase):
         message_input = page.locator("#message-input")
         await message_input.fill(message_text)
         await message_input.press("Enter")
-        await asyncio.sleep(1)
-
-    async def _add_reaction_in_widget(self, page, message_text, emoji):
-        """Helper to add a reaction in the DM widget"""
-        # Messages in widget have data-message-id attribute, not message-item class
-        message = page.locator("#widget-message-list [data-message-id]").filter(has_text=message_text)
-
-        # Find the visible emoji button (one container has display:none, the other has display:flex)
-        # Use JavaScript to click the visible emoji button
-        await page.evaluate("""(messageText) => {
-            const messages = document.querySelectorAll('#widget-message-list [data-message-id]');
-            for (const msg of messages) {
-                if (msg.textContent.includes(messageText)) {
-                    // Find all emoji buttons in this message
-                    const emojiBtns = msg.querySelectorAll('.emoji-btn');
-                    for (const btn of emojiBtns) {
-                        // Check if button is in a visible container (offsetParent !== null means it's rendered)
-                        if (btn.offsetParent !== null) {
-                            btn.click();
-                            return true;
-                        }
-                    }
-                }
-            }
-            return false;
-        }""", message_text)
-
-        await asyncio.sleep(1)
-        # Wait for emoji picker to be visible
-        emoji_picker = page.locator("emoji-picker")
-        await expect(emoji_picker).to_be_visible(timeout=10000)
-        # Click the emoji in the picker
-        emoji_option = emoji_picker.get_by_text(emoji).first
-        await emoji_option.click()
-        await asyncio.sleep(1)
+        # The messages page clears the input once the message has been sent
+        await self._wait_until(
+            page, "el => el.value === ''", arg=await message_input.element_handle()
+        )
 
-    async def _add_reaction_in_messages_page(self, page, message_text, emoji):
-        """Helper to add a reaction in the messages page"""
+    async def _add_reaction(self, page, message_list, message_text, emoji):
+        """Helper to add a reaction in the given message list"""
         # Messages have data-message-id attribute, not message-item class
-        message = page.locator("#message-list [data-message-id]").filter(has_text=message_text)
-
-        # Find the visible emoji button (one container has display:none, the other has display:flex)
-        # Use JavaScript to click the visible emoji button
-        await page.evaluate("""(messageText) => {
-            const messages = document.querySelectorAll('#message-list [data-message-id]');
-            for (const msg of messages) {
-                if (msg.textContent.includes(messageText)) {
-                    // Find all emoji buttons in this message
-                    const emojiBtns = msg.querySelectorAll('.emoji-btn');
-                    for (const btn of emojiBtns) {
-                        // Check if button is in a visible container (offsetParent !== null means it's rendered)
-                        if (btn.offsetParent !== null) {
-                            btn.click();
-                            return true;
-                        }
-                    }
-                }
-            }
-            return false;
-        }""", message_text)
-
-        await asyncio.sleep(1)
+        message = page.locator(f"{message_list} [data-message-id]").filter(has_text=message_text)
+
+        # Use JavaScript to click the visible emoji button on the resolved message element
+        await message.evaluate(CLICK_EMOJI_BUTTON_JS)
+
         # Wait for emoji picker to be visible
         emoji_picker = page.locator("emoji-picker")
         await expect(emoji_picker).to_be_visible(timeout=10000)
         # Click the emoji in the picker
         emoji_option = emoji_picker.get_by_text(emoji).first
         await emoji_option.click()
-        await asyncio.sleep(1)
+        # Wait for the reaction to show up on the message
+        await expect(message.locator(".reaction").filter(has_text=emoji)).to_be_visible()
 
-    async def _remove_reaction_in_widget(self, page, message_text, emoji):
-        """Helper to remove a reaction in the DM widget"""
-        message = page.locator("#widget-message-list [data-message-id]").filter(has_text=message_text)
+    async def _remove_reaction(self, page, message_list, message_text, emoji):
+        """Helper to remove a reaction in the given message list"""
+        message = page.locator(f"{message_list} [data-message-id]").filter(has_text=message_text)
         # Click the reaction button (not the emoji span which has pointer-events-none)
         reaction_button = message.locator(".reaction").filter(has_text=emoji)
         await reaction_button.click()
-        await asyncio.sleep(1)
+        await expect(reaction_button).to_have_count(0)
 
-    async def _remove_reaction_in_messages_page(self, page, message_text, emoji):
-        """Helper to remove a reaction in the messages page"""
-        message = page.locator("#message-list [data-message-id]").filter(has_text=message_text)
-        # Click the reaction button (not the emoji span which has pointer-events-none)
-        reaction_button = message.locator(".reaction").filter(has_text=emoji)
-        await reaction_button.click()
-        await asyncio.sleep(1)
+    async def _click_context_menu_action(self, page, message_list, message_text, action):
+        """Helper to click an action (e.g. '.edit-btn') in a message's context menu"""
+        message = page.locator(f"{message_list} [data-message-id]").filter(has_text=message_text)
+        # Use JavaScript to open the message's context menu and click the action - all in one call
+        result = await message.evaluate(CONTEXT_MENU_ACTION_JS, action)
+
+        if not result['success']:
+            raise Exception(f"Could not click {action}: {result.get('error', 'Unknown error')}")
 
     async def _edit_message_in_widget(self, page, original_text, new_text):
         """Helper to edit a message in the DM widget"""
-        # Use JavaScript to click the visible context menu button and edit button
-        await page.evaluate("""(messageText) => {
-            const messages = document.querySelectorAll('#widget-message-list [data-message-id]');
-            for (const msg of messages) {
-                if (msg.textContent.includes(messageText)) {
-                    const contextMenuBtns = msg.querySelectorAll('.context-menu-btn');
-                    for (const btn of contextMenuBtns) {
-                        if (btn.offsetParent !== null) {
-                            btn.click();
-                            return true;
-                        }
-                    }
-                }
-            }
-            return false;
-        }""", original_text)
-
-        await asyncio.sleep(0.5)
-
-        # Use JavaScript to click the edit button
-        await page.evaluate("""() => {
-            const editBtn = document.querySelector('#fixed-chat-widget .edit-btn');
-            if (editBtn) {
-                editBtn.click();
-                return true;
-            }
-            return false;
-        }""")
-
-        await asyncio.sleep(0.3)
+        await self._click_context_menu_action(page, WIDGET_MESSAGE_LIST, original_text, ".edit-btn")
+
+        # The save button appears once the widget has switched into edit mode
+        save_btn = page.locator("#fixed-chat-widget .edit-save-btn")
+        await expect(save_btn).to_be_visible()
 
         # Edit the message in the main message input field
         message_input = page.locator("#widget-message-input")
         await message_input.fill(new_text)
         # Save the edit
-        save_btn = page.locator("#fixed-chat-widget .edit-save-btn")
         await save_btn.click()
-        await asyncio.sleep(1)
+        await expect(page.locator(WIDGET_MESSAGE_LIST).get_by_text(new_text)).to_be_visible()
 
     async def _edit_message_in_messages_page(self, page, original_text, new_text):
         """Helper to edit a message in the messages page"""
-        # Use JavaScript to find the message, open context menu, and click edit - all in one call
-        result = await page.evaluate("""(messageText) => {
-            const messages = document.querySelectorAll('#message-list [data-message-id]');
-            for (const msg of messages) {
-                if (msg.textContent.includes(messageText)) {
-                    // Find and click the visible context menu button
-                    const contextMenuBtns = msg.querySelectorAll('.context-menu-btn');
-                    let contextMenuBtn = null;
-                    for (const btn of contextMenuBtns) {
-                        if (btn.offsetParent !== null) {
-                            contextMenuBtn = btn;
-                            break;
-                        }
-                    }
-
-                    if (!contextMenuBtn) {
-                        return {success: false, error: 'Context menu button not found or not visible'};
-                    }
-
-                    // Click to open context menu
-                    contextMenuBtn.click();
-
-                    // Find the context menu (it's a sibling of the button)
-                    const contextMenu = contextMenuBtn.parentElement.querySelector('.context-menu');
-                    if (!contextMenu) {
-                        return {success: false, error: 'Context menu element not found'};
-                    }
-
-                    // Remove hidden class to show menu
-                    contextMenu.classList.remove('hidden');
-
-                    // Find and click the edit button
-                    const editBtn = contextMenu.querySelector('.edit-btn');
-                    if (!editBtn) {
-                        return {success: false, error: 'Edit button not found in context menu'};
-                    }
-
-                    editBtn.click();
-                    return {success: true};
-                }
-            }
-            return {success: false, error: 'Message not found'};
-        }""", original_text)
+        await self._click_context_menu_action(page, MESSAGE_LIST, original_text, ".edit-btn")
 
-        if not result['success']:
-            raise Exception(f"Could not edit message: {result.get('error', 'Unknown error')}")
-
-        await asyncio.sleep(0.5)
+        # Save the edit - edit buttons are added to the form, not scoped to messages-container
+        # The save button appears once the page has switched into edit mode
+        save_btn = page.locator(".edit-save-btn")
+        await expect(save_btn).to_be_visible()
 
         # Edit the message in the main message input field
         message_input = page.locator("#message-input")
         await message_input.fill(new_text)
-
-        await asyncio.sleep(0.3)
-
-        # Save the edit - edit buttons are added to the form, not scoped to messages-container
-        save_btn = page.locator(".edit-save-btn")
         await save_btn.click()
-        await asyncio.sleep(1)
-
-    async def _delete_message_in_widget(self, page, message_text):
-        """Helper to delete a message in the DM widget"""
-        # Use JavaScript to find the message, open context menu, and click delete - all in one call
-        result = await page.evaluate("""(messageText) => {
-            const messages = document.querySelectorAll('#widget-message-list [data-message-id]');
-            for (const msg of messages) {
-                if (msg.textContent.includes(messageText)) {
-                    // Find and click the visible context menu button
-                    const contextMenuBtns = msg.querySelectorAll('.context-menu-btn');
-                    let contextMenuBtn = null;
-                    for (const btn of contextMenuBtns) {
-                        if (btn.offsetParent !== null) {
-                            contextMenuBtn = btn;
-                            break;
-                        }
-                    }
-
-                    if (!contextMenuBtn) {
-                        return {success: false, error: 'Context menu button not found or not visible'};
-                    }
-
-                    // Click to open context menu
-                    contextMenuBtn.click();
-
-                    // Find the context menu (it's a sibling of the button)
-                    const contextMenu = contextMenuBtn.parentElement.querySelector('.context-menu');
-                    if (!contextMenu) {
-                        return {success: false, error: 'Context menu element not found'};
-                    }
-
-                    // Remove hidden class to show menu
-                    contextMenu.classList.remove('hidden');
-
-                    // Find and click the delete button
-                    const deleteBtn = contextMenu.querySelector('.delete-btn');
-                    if (!deleteBtn) {
-                        return {success: false, error: 'Delete button not found in context menu'};
-                    }
-
-                    deleteBtn.click();
-                    return {success: true};
-                }
-            }
-            return {success: false, error: 'Message not found'};
-        }""", message_text)
+        await expect(page.locator(MESSAGE_LIST).get_by_text(new_text)).to_be_visible()
 
-        if not result['success']:
-            raise Exception(f"Could not delete message: {result.get('error', 'Unknown error')}")
-
-        await asyncio.sleep(1)
-
-    async def _delete_message_in_messages_page(self, page, message_text):
-        """Helper to delete a message in the messages page"""
-        # Use JavaScript to find the message, open context menu, and click delete - all in one call
-        result = await page.evaluate("""(messageText) => {
-            const messages = document.querySelectorAll('#message-list [data-message-id]');
-            for (const msg of messages) {
-                if (msg.textContent.includes(messageText)) {
-                    // Find and click the visible context menu button
-                    const contextMenuBtns = msg.querySelectorAll('.context-menu-btn');
-                    let contextMenuBtn = null;
-                    for (const btn of contextMenuBtns) {
-                        if (btn.offsetParent !== null) {
-                            contextMenuBtn = btn;
-                            break;
-                        }
-                    }
-
-                    if (!contextMenuBtn) {
-                        return {success: false, error: 'Context menu button not found or not visible'};
-                    }
-
-                    // Click to open context menu
-                    contextMenuBtn.click();
-
-                    // Find the context menu (it's a sibling of the button)
-                    const contextMenu = contextMenuBtn.parentElement.querySelector('.context-menu');
-                    if (!contextMenu) {
-                        return {success: false, error: 'Context menu element not found'};
-                    }
-
-                    // Remove hidden class to show menu
-                    contextMenu.classList.remove('hidden');
-
-                    // Find and click the delete button
-                    const deleteBtn = contextMenu.querySelector('.delete-btn');
-                    if (!deleteBtn) {
-                        return {success: false, error: 'Delete button not found in context menu'};
-                    }
-
-                    deleteBtn.click();
-                    return {success: true};
-                }
-            }
-            return {success: false, error: 'Message not found'};
-        }""", message_text)
-
-        if not result['success']:
-            raise Exception(f"Could not delete message: {result.get('error', 'Unknown error')}")
+    async def _delete_message(self, page, message_list, message_text):
+        """Helper to delete a message in the given message list"""
+        await self._click_context_menu_action(page, message_list, message_text, ".delete-btn")
 
-        await asyncio.sleep(1)
+        # Wait for the message text to be replaced by the deleted indicator
+        await expect(page.locator(message_list).get_by_text(message_text)).to_have_count(0)
 
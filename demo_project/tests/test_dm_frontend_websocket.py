@@ -19,13 +19,90 @@ import asyncio
 import pytest
 from playwright.async_api import async_playwright, expect
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from channels.testing import ChannelsLiveServerTestCase
 from django.test import override_settings
 from django.urls import reverse
-from .conftest import position_browser_windows_side_by_side
+
+try:
+    # Optional C event loop for the Playwright driver connection
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from .conftest import (
+    HEADED,
+    browser_launch_options,
+    logged_in_storage_state,
+    position_browser_windows_side_by_side,
+)
 
 User = get_user_model()
 
+# Message lists of the DM widget and of the messages page
+WIDGET_MESSAGE_LIST = "#widget-message-list"
+MESSAGE_LIST = "#message-list"
+
+
+def message_selector(message_list, message_id):
+    """Return the selector of a message in a message list by its id"""
+    return f'{message_list} [data-message-id="{message_id}"]'
+
+
+# Click the visible emoji button of a message
+CLICK_EMOJI_BUTTON_JS = """({messageList, messageText}) => {
+    const messages = document.querySelectorAll(`${messageList} [data-message-id]`);
+    for (const msg of messages) {
+        if (msg.textContent.includes(messageText)) {
+            for (const btn of msg.querySelectorAll('.emoji-btn')) {
+                if (btn.offsetParent !== null) {
+                    btn.click();
+                    return true;
+                }
+            }
+        }
+    }
+    return false;
+}"""
+
+# Open the context menu of a message and click one of its actions
+CONTEXT_MENU_ACTION_JS = """({messageList, messageText, action}) => {
+    const messages = document.querySelectorAll(`${messageList} [data-message-id]`);
+    for (const msg of messages) {
+        if (msg.textContent.includes(messageText)) {
+            let contextMenuBtn = null;
+            for (const btn of msg.querySelectorAll('.context-menu-btn')) {
+                if (btn.offsetParent !== null) {
+                    contextMenuBtn = btn;
+                    break;
+                }
+            }
+
+            if (!contextMenuBtn) {
+                return {success: false, error: 'Context menu button not found or not visible'};
+            }
+
+            contextMenuBtn.click();
+
+            const contextMenu = contextMenuBtn.parentElement.querySelector('.context-menu');
+            if (!contextMenu) {
+                return {success: false, error: 'Context menu element not found'};
+            }
+
+            contextMenu.classList.remove('hidden');
+
+            const actionBtn = contextMenu.querySelector(action);
+            if (!actionBtn) {
+                return {success: false, error: `${action} not found in context menu`};
+            }
+
+            actionBtn.click();
+            return {success: true};
+        }
+    }
+    return {success: false, error: 'Message not found'};
+}"""
+
 
 @pytest.mark.frontend
 @pytest.mark.slow
@@ -46,554 +123,392 @@ class DMFrontendWebSocketTestCase(ChannelsLiveServerTestCase):
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
-        cls.sender = User.objects.create_user(
-            username="sender_user_ws",
-            password="testpass123",
-            email="sender_ws@test.com",
-            first_name="Sender",
-            last_name="User",
+        # Hash the shared password once and insert both users together
+        password = make_password("testpass123")
+        cls.sender, cls.receiver = User.objects.bulk_create(
+            [
+                User(
+                    username="sender_user_ws",
+                    password=password,
+                    email="sender_ws@test.com",
+                    first_name="Sender",
+                    last_name="User",
+                ),
+                User(
+                    username="receiver_user_ws",
+                    password=password,
+                    email="receiver_ws@test.com",
+                    first_name="Receiver",
+                    last_name="User",
+                ),
+            ]
         )
-        cls.receiver = User.objects.create_user(
-            username="receiver_user_ws",
-            password="testpass123",
-            email="receiver_ws@test.com",
-            first_name="Receiver",
-            last_name="User",
+
+        # Resolve the URLs once for all test methods
+        cls.messages_url = f"{cls.live_server_url}{reverse('django_messaging:messaging-view')}"
+        person_detail_url = reverse('people:person_detail', kwargs={'user_id': cls.receiver.id})
+        cls.receiver_profile_url = f"{cls.live_server_url}{person_detail_url}"
+
+        # Launch one browser for all test methods; Playwright objects are bound
+        # to the event loop that created them, so the class keeps that loop
+        cls._loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+        cls._playwright = cls._loop.run_until_complete(async_playwright().start())
+        # Headless by default; HEADED=1 shows the windows in slow motion
+        cls._browser = cls._loop.run_until_complete(
+            cls._playwright.chromium.launch(**browser_launch_options())
         )
 
+    @classmethod
+    def tearDownClass(cls):
+        cls._loop.run_until_complete(cls._browser.close())
+        cls._loop.run_until_complete(cls._playwright.stop())
+        cls._loop.close()
+        super().tearDownClass()
+
     def test_dm_real_time_messaging(self):
         """Test complete DM workflow with real-time WebSocket updates"""
-        asyncio.run(self._test_dm_real_time_messaging())
+        sender_state = logged_in_storage_state(self.sender, self.live_server_url)
+        receiver_state = logged_in_storage_state(self.receiver, self.live_server_url)
+        self._loop.run_until_complete(
+            self._test_dm_real_time_messaging(sender_state, receiver_state)
+        )
 
-    async def _test_dm_real_time_messaging(self):
+    async def _test_dm_real_time_messaging(self, sender_state, receiver_state):
         """Async test for DM real-time messaging via WebSocket"""
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=False, slow_mo=500)
-
-            sender_context = await browser.new_context()
-            sender_page = await sender_context.new_page()
-
-            receiver_context = await browser.new_context()
-            receiver_page = await receiver_context.new_page()
+        # Start both users logged in instead of going through the login form;
+        # contexts share no state, so set up both users concurrently
+        sender_context, receiver_context = await asyncio.gather(
+            self._browser.new_context(storage_state=sender_state),
+            self._browser.new_context(storage_state=receiver_state),
+        )
+        sender_page, receiver_page = await asyncio.gather(
+            sender_context.new_page(), receiver_context.new_page()
+        )
 
+        if HEADED:
             # Position windows side by side
             await position_browser_windows_side_by_side(sender_page, receiver_page)
 
-            try:
-                await self._login(sender_page, "sender_user_ws", "testpass123")
-                await self._login(receiver_page, "receiver_user_ws", "testpass123")
-
-                messages_url = reverse('django_messaging:messaging-view')
-                await receiver_page.goto(f"{self.live_server_url}{messages_url}")
-                await receiver_page.wait_for_load_state("networkidle")
-
-                transport_check = await receiver_page.evaluate(
-                    """
-                    () => {
-                        return {
-                            hasPollingTransport: typeof PollingTransport !== 'undefined',
-                            hasWebSocketTransport: typeof WebSocketTransport !== 'undefined',
-                            transportType: window.chatApp?.wsTransport?.constructor?.name || 'unknown'
-                        };
-                    }
-                """
-                )
-                print(f"🔍 Transport check: {transport_check}")
-                if not transport_check["hasWebSocketTransport"]:
-                    print("⚠️ WARNING: WebSocketTransport not loaded!")
-                if transport_check["transportType"] != "WebSocketTransport":
-                    print(
-                        f"⚠️ WARNING: Using {transport_check['transportType']} instead of WebSocketTransport!"
-                    )
-
-                person_detail_url = reverse('people:person_detail', kwargs={'user_id': self.receiver.id})
-                await sender_page.goto(
-                    f"{self.live_server_url}{person_detail_url}"
-                )
-                await sender_page.wait_for_load_state("networkidle")
+        try:
+            # goto() returns after the load event; networkidle never settles
+            # while the pages hold their WebSocket open
+            await asyncio.gather(
+                receiver_page.goto(self.messages_url),
+                sender_page.goto(self.receiver_profile_url),
+            )
 
-                chat_toggle_btn = sender_page.locator("#chat-toggle-btn")
-                await expect(chat_toggle_btn).to_be_visible()
-                await chat_toggle_btn.click()
+            # Block until the chat app is up on the WebSocket transport
+            await receiver_page.wait_for_function(
+                "() => window.chatApp?.wsTransport?.constructor?.name === 'WebSocketTransport'",
+                timeout=10000,
+            )
 
-                widget = sender_page.locator("#fixed-chat-widget")
-                await expect(widget).to_be_visible()
+            chat_toggle_btn = sender_page.locator("#chat-toggle-btn")
+            await expect(chat_toggle_btn).to_be_visible()
+            await chat_toggle_btn.click()
 
-                print("📤 Test 1: Sending message from sender via WebSocket...")
-                await self._send_message_in_widget(sender_page, "Hello via WebSocket!")
+            widget = sender_page.locator("#fixed-chat-widget")
+            await expect(widget).to_be_visible()
 
-                await expect(
-                    sender_page.locator("#widget-message-list").get_by_text(
-                        "Hello via WebSocket!"
-                    )
-                ).to_be_visible(timeout=10000)
+            print("📤 Test 1: Sending message from sender via WebSocket...")
+            await self._send_message_in_widget(sender_page, "Hello via WebSocket!")
 
-                print(
-                    "📥 Test 2: Receiver sees new chat via WebSocket and selects it..."
+            await expect(
+                sender_page.locator(WIDGET_MESSAGE_LIST).get_by_text(
+                    "Hello via WebSocket!"
                 )
-                print("⏳ WebSocket should push the update instantly...")
+            ).to_be_visible(timeout=10000)
+            # Messages are rendered under their database id on both pages, so
+            # look the id up once and select by attribute from here on
+            sender_message_id = await self._message_id(
+                sender_page, WIDGET_MESSAGE_LIST, "Hello via WebSocket!"
+            )
 
-                await asyncio.sleep(2)
+            print(
+                "📥 Test 2: Receiver sees new chat via WebSocket and selects it..."
+            )
+            print("⏳ WebSocket should push the update instantly...")
 
-                sender_name = self.sender.first_name
-                chat_item = receiver_page.locator(".chat-item").filter(
-                    has_text=sender_name
-                )
-                await expect(chat_item).to_be_visible(timeout=10000)
-                print(f"✅ Chat with '{sender_name}' is visible")
+            sender_name = self.sender.first_name
+            chat_item = receiver_page.locator(".chat-item").filter(
+                has_text=sender_name
+            )
+            await expect(chat_item).to_be_visible(timeout=10000)
+            print(f"✅ Chat with '{sender_name}' is visible")
 
-                await chat_item.click()
-                await asyncio.sleep(2)
+            await chat_item.click()
 
-                message_list = receiver_page.locator("#message-list")
-                await expect(message_list).to_be_visible(timeout=10000)
+            message_list = receiver_page.locator(MESSAGE_LIST)
+            await expect(message_list).to_be_visible(timeout=10000)
 
-                print("📥 Verifying receiver sees message via WebSocket...")
-                await expect(
-                    message_list.get_by_text("Hello via WebSocket!")
-                ).to_be_visible(timeout=10000)
+            print("📥 Verifying receiver sees message via WebSocket...")
+            await expect(
+                message_list.get_by_text("Hello via WebSocket!")
+            ).to_be_visible(timeout=10000)
+
+            print("📤 Test 3: Receiver sends reply...")
+            await self._send_message_in_messages_page(
+                receiver_page, "Hello from receiver!"
+            )
 
-                print("📤 Test 3: Receiver sends reply...")
-                await self._send_message_in_messages_page(
-                    receiver_page, "Hello from receiver!"
+            print("📥 Verifying sender receives reply via WebSocket...")
+            await expect(
+                sender_page.locator(WIDGET_MESSAGE_LIST).get_by_text(
+                    "Hello from receiver!"
                 )
+            ).to_be_visible(timeout=10000)
+            receiver_message_id = await self._message_id(
+                sender_page, WIDGET_MESSAGE_LIST, "Hello from receiver!"
+            )
 
-                print("📥 Verifying sender receives reply via WebSocket...")
-                await expect(
-                    sender_page.locator("#widget-message-list").get_by_text(
-                        "Hello from receiver!"
-                    )
-                ).to_be_visible(timeout=10000)
+            print("👍 Test 4: Sender adds reaction...")
+            await self._add_reaction(
+                sender_page, WIDGET_MESSAGE_LIST, "Hello from receiver!", "👍"
+            )
 
-                print("👍 Test 4: Sender adds reaction...")
-                await self._add_reaction_in_widget(
-                    sender_page, "Hello from receiver!", "👍"
-                )
+            print("📥 Test 5: Verifying receiver sees reaction via WebSocket...")
+            receiver_message = receiver_page.locator(
+                message_selector(MESSAGE_LIST, receiver_message_id)
+            )
+            await expect(
+                receiver_message.locator(".reaction").filter(has_text="👍")
+            ).to_be_visible(timeout=10000)
 
-                print("📥 Test 5: Verifying receiver sees reaction via WebSocket...")
-                receiver_message = receiver_page.locator(
-                    "#message-list [data-message-id]"
-                ).filter(has_text="Hello from receiver!")
-                await expect(
-                    receiver_message.locator(".reaction").filter(has_text="👍")
-                ).to_be_visible(timeout=10000)
-
-                print("❤️ Test 6: Receiver adds reaction...")
-                await self._add_reaction_in_messages_page(
-                    receiver_page, "Hello via WebSocket!", "❤️"
-                )
+            print("❤️ Test 6: Receiver adds reaction...")
+            await self._add_reaction(
+                receiver_page, MESSAGE_LIST, "Hello via WebSocket!", "❤️"
+            )
 
-                print("📥 Test 7: Verifying sender sees reaction via WebSocket...")
-                sender_message = sender_page.locator(
-                    "#widget-message-list [data-message-id]"
-                ).filter(has_text="Hello via WebSocket!")
-                await expect(
-                    sender_message.locator(".reaction").filter(has_text="❤️")
-                ).to_be_visible(timeout=10000)
-
-                print("🗑️ Test 8: Sender removes reaction...")
-                await self._remove_reaction_in_widget(
-                    sender_page, "Hello from receiver!", "👍"
-                )
+            print("📥 Test 7: Verifying sender sees reaction via WebSocket...")
+            sender_message = sender_page.locator(
+                message_selector(WIDGET_MESSAGE_LIST, sender_message_id)
+            )
+            await expect(
+                sender_message.locator(".reaction").filter(has_text="❤️")
+            ).to_be_visible(timeout=10000)
 
-                print(
-                    "📥 Test 9: Verifying receiver sees reaction removed via WebSocket..."
-                )
-                receiver_message = receiver_page.locator(
-                    "#message-list [data-message-id]"
-                ).filter(has_text="Hello from receiver!")
-                await expect(
-                    receiver_message.locator(".reaction").filter(has_text="👍")
-                ).not_to_be_visible(timeout=10000)
-
-                print("🗑️ Test 10: Receiver removes reaction...")
-                await self._remove_reaction_in_messages_page(
-                    receiver_page, "Hello via WebSocket!", "❤️"
-                )
+            print("🗑️ Test 8: Sender removes reaction...")
+            await self._remove_reaction(
+                sender_page, WIDGET_MESSAGE_LIST, "Hello from receiver!", "👍"
+            )
 
-                print(
-                    "📥 Test 11: Verifying sender sees reaction removed via WebSocket..."
-                )
-                sender_message = sender_page.locator(
-                    "#widget-message-list [data-message-id]"
-                ).filter(has_text="Hello via WebSocket!")
-                await expect(
-                    sender_message.locator(".reaction").filter(has_text="❤️")
-                ).not_to_be_visible(timeout=10000)
-
-                print("✏️ Test 12: Sender edits message...")
-                await self._edit_message_in_widget(
-                    sender_page, "Hello via WebSocket!", "Hello via WebSocket (edited)!"
-                )
+            print(
+                "📥 Test 9: Verifying receiver sees reaction removed via WebSocket..."
+            )
+            await expect(
+                receiver_message.locator(".reaction").filter(has_text="👍")
+            ).not_to_be_visible(timeout=10000)
+
+            print("🗑️ Test 10: Receiver removes reaction...")
+            await self._remove_reaction(
+                receiver_page, MESSAGE_LIST, "Hello via WebSocket!", "❤️"
+            )
+
+            print(
+                "📥 Test 11: Verifying sender sees reaction removed via WebSocket..."
+            )
+            await expect(
+                sender_message.locator(".reaction").filter(has_text="❤️")
+            ).not_to_be_visible(timeout=10000)
 
-                print(
-                    "📥 Test 13: Verifying receiver sees edited message via WebSocket..."
+            print("✏️ Test 12: Sender edits message...")
+            await self._edit_message_in_widget(
+                sender_page, "Hello via WebSocket!", "Hello via WebSocket (edited)!"
+            )
+
+            print(
+                "📥 Test 13: Verifying receiver sees edited message via WebSocket..."
+            )
+            await expect(
+                receiver_page.locator(MESSAGE_LIST).get_by_text(
+                    "Hello via WebSocket (edited)!"
                 )
-                await expect(
-                    receiver_page.locator("#message-list").get_by_text(
-                        "Hello via WebSocket (edited)!"
-                    )
-                ).to_be_visible(timeout=10000)
-                edited_message = receiver_page.locator(
-                    "#message-list [data-message-id]"
-                ).filter(has_text="Hello via WebSocket (edited)!")
-                await edited_message.locator(".message-bubble").click()
-                await asyncio.sleep(0.3)
-                timestamp = edited_message.locator(".message-timestamp")
-                await expect(timestamp).to_be_visible()
-                await expect(timestamp).to_contain_text("Edited")
-
-                print("✏️ Test 14: Receiver edits message...")
-                await self._edit_message_in_messages_page(
-                    receiver_page,
-                    "Hello from receiver!",
-                    "Hello from receiver (edited)!",
+            ).to_be_visible(timeout=10000)
+            edited_message = receiver_page.locator(
+                message_selector(MESSAGE_LIST, sender_message_id)
+            )
+            self.assertIn("Edited", await self._reveal_timestamp(edited_message))
+
+            print("✏️ Test 14: Receiver edits message...")
+            await self._edit_message_in_messages_page(
+                receiver_page,
+                "Hello from receiver!",
+                "Hello from receiver (edited)!",
+            )
+
+            print(
+                "📥 Test 15: Verifying sender sees edited message via WebSocket..."
+            )
+            await expect(
+                sender_page.locator(WIDGET_MESSAGE_LIST).get_by_text(
+                    "Hello from receiver (edited)!"
                 )
+            ).to_be_visible(timeout=10000)
+            edited_message_widget = sender_page.locator(
+                message_selector(WIDGET_MESSAGE_LIST, receiver_message_id)
+            )
+            self.assertIn(
+                "Edited", await self._reveal_timestamp(edited_message_widget)
+            )
+
+            print("🗑️ Test 16: Sender deletes message...")
+            await self._delete_message(
+                sender_page, WIDGET_MESSAGE_LIST, "Hello via WebSocket (edited)!"
+            )
 
-                print(
-                    "📥 Test 15: Verifying sender sees edited message via WebSocket..."
+            print(
+                "📥 Test 17: Verifying receiver sees deleted message via WebSocket..."
+            )
+            await expect(
+                receiver_page.locator(MESSAGE_LIST).get_by_text(
+                    "Hello via WebSocket (edited)!"
                 )
-                await expect(
-                    sender_page.locator("#widget-message-list").get_by_text(
-                        "Hello from receiver (edited)!"
-                    )
-                ).to_be_visible(timeout=10000)
-                edited_message_widget = sender_page.locator(
-                    "#widget-message-list [data-message-id]"
-                ).filter(has_text="Hello from receiver (edited)!")
-                await edited_message_widget.locator(".message-bubble").click()
-                await asyncio.sleep(0.3)
-                timestamp_widget = edited_message_widget.locator(".message-timestamp")
-                await expect(timestamp_widget).to_be_visible()
-                await expect(timestamp_widget).to_contain_text("Edited")
-
-                print("🗑️ Test 16: Sender deletes message...")
-                await self._delete_message_in_widget(
-                    sender_page, "Hello via WebSocket (edited)!"
+            ).to_have_count(0, timeout=10000)
+            await expect(
+                receiver_page.locator(
+                    message_selector(MESSAGE_LIST, sender_message_id)
+                    + " .deleted-indicator"
                 )
+            ).to_be_visible()
+
+            print("🗑️ Test 18: Receiver deletes message...")
+            await self._delete_message(
+                receiver_page, MESSAGE_LIST, "Hello from receiver (edited)!"
+            )
 
-                print(
-                    "📥 Test 17: Verifying receiver sees deleted message via WebSocket..."
+            print(
+                "📥 Test 19: Verifying sender sees deleted message via WebSocket..."
+            )
+            # The sender's own deletion left an indicator too, so only look
+            # at the receiver's message
+            await expect(
+                sender_page.locator(WIDGET_MESSAGE_LIST).get_by_text(
+                    "Hello from receiver (edited)!"
                 )
-                await asyncio.sleep(2.5)
-                await expect(
-                    receiver_page.locator(".deleted-indicator").first
-                ).to_be_visible(timeout=10000)
-
-                print("🗑️ Test 18: Receiver deletes message...")
-                await self._delete_message_in_messages_page(
-                    receiver_page, "Hello from receiver (edited)!"
+            ).to_have_count(0, timeout=10000)
+            await expect(
+                sender_page.locator(
+                    message_selector(WIDGET_MESSAGE_LIST, receiver_message_id)
+                    + " .deleted-indicator"
                 )
+            ).to_be_visible()
 
-                print(
-                    "📥 Test 19: Verifying sender sees deleted message via WebSocket..."
-                )
-                await asyncio.sleep(2.5)
-                await expect(
-                    sender_page.locator(".deleted-indicator").first
-                ).to_be_visible(timeout=10000)
-
-                print("✅ All DM WebSocket tests passed!")
-
-            finally:
-                await sender_context.close()
-                await receiver_context.close()
-                await browser.close()
-
-    async def _login(self, page, username, password):
-        """Helper to login a user"""
-        login_url = reverse('login')
-        await page.goto(f"{self.live_server_url}{login_url}")
-        await page.fill('input[name="username"]', username)
-        await page.fill('input[name="password"]', password)
-        await page.click('button[type="submit"]')
-        await page.wait_for_load_state("networkidle")
+            print("✅ All DM WebSocket tests passed!")
+
+        finally:
+            await sender_context.close()
+            await receiver_context.close()
+
+    async def _message_id(self, page, message_list, message_text):
+        """Helper to look up the data-message-id of a message by its text"""
+        message = page.locator(f"{message_list} [data-message-id]").filter(
+            has_text=message_text
+        )
+        return await message.get_attribute("data-message-id")
+
+    async def _reveal_timestamp(self, message):
+        """Helper to click a message bubble and read its timestamp in one call"""
+        return await message.evaluate(
+            """msg => {
+            msg.querySelector('.message-bubble').click();
+            return msg.querySelector('.message-timestamp')?.textContent || '';
+        }"""
+        )
 
     async def _send_message_in_widget(self, page, message_text):
         """Helper to send a message in the DM widget"""
         message_input = page.locator("#widget-message-input")
         await message_input.fill(message_text)
         await message_input.press("Enter")
-        await asyncio.sleep(1)
+        await self._wait_for_cleared_input(page, message_input)
 
     async def _send_message_in_messages_page(self, page, message_text):
         """Helper to send a message in the messages page"""
         message_input = page.locator("#message-input")
         await message_input.fill(message_text)
         await message_input.press("Enter")
-        await asyncio.sleep(1)
+        await self._wait_for_cleared_input(page, message_input)
 
-    async def _add_reaction_in_widget(self, page, message_text, emoji):
-        """Helper to add a reaction in the DM widget"""
-        await page.evaluate(
-            """(messageText) => {
-            const messages = document.querySelectorAll('#widget-message-list [data-message-id]');
-            for (const msg of messages) {
-                if (msg.textContent.includes(messageText)) {
-                    const emojiBtns = msg.querySelectorAll('.emoji-btn');
-                    for (const btn of emojiBtns) {
-                        if (btn.offsetParent !== null) {
-                            btn.click();
-                            return true;
-                        }
-                    }
-                }
-            }
-            return false;
-        }""",
-            message_text,
+    async def _wait_for_cleared_input(self, page, message_input):
+        """Helper to wait for the input to be cleared once a message is sent"""
+        await page.wait_for_function(
+            "el => el.value === ''", arg=await message_input.element_handle()
         )
 
-        await asyncio.sleep(1)
-        emoji_picker = page.locator("emoji-picker")
-        await expect(emoji_picker).to_be_visible(timeout=10000)
-        emoji_option = emoji_picker.get_by_text(emoji).first
-        await emoji_option.click()
-        await asyncio.sleep(1)
-
-    async def _add_reaction_in_messages_page(self, page, message_text, emoji):
-        """Helper to add a reaction in the messages page"""
+    async def _add_reaction(self, page, message_list, message_text, emoji):
+        """Helper to add a reaction in the given message list"""
+        message = page.locator(f"{message_list} [data-message-id]").filter(
+            has_text=message_text
+        )
         await page.evaluate(
-            """(messageText) => {
-            const messages = document.querySelectorAll('#message-list [data-message-id]');
-            for (const msg of messages) {
-                if (msg.textContent.includes(messageText)) {
-                    const emojiBtns = msg.querySelectorAll('.emoji-btn');
-                    for (const btn of emojiBtns) {
-                        if (btn.offsetParent !== null) {
-                            btn.click();
-                            return true;
-                        }
-                    }
-                }
-            }
-            return false;
-        }""",
-            message_text,
+            CLICK_EMOJI_BUTTON_JS,
+            {"messageList": message_list, "messageText": message_text},
         )
 
-        await asyncio.sleep(1)
         emoji_picker = page.locator("emoji-picker")
         await expect(emoji_picker).to_be_visible(timeout=10000)
         emoji_option = emoji_picker.get_by_text(emoji).first
         await emoji_option.click()
-        await asyncio.sleep(1)
+        await expect(message.locator(".reaction").filter(has_text=emoji)).to_be_visible()
 
-    async def _remove_reaction_in_widget(self, page, message_text, emoji):
-        """Helper to remove a reaction in the DM widget"""
-        message = page.locator("#widget-message-list [data-message-id]").filter(
+    async def _remove_reaction(self, page, message_list, message_text, emoji):
+        """Helper to remove a reaction in the given message list"""
+        message = page.locator(f"{message_list} [data-message-id]").filter(
             has_text=message_text
         )
         reaction_button = message.locator(".reaction").filter(has_text=emoji)
         await reaction_button.click()
-        await asyncio.sleep(1)
+        await expect(reaction_button).to_have_count(0)
 
-    async def _remove_reaction_in_messages_page(self, page, message_text, emoji):
-        """Helper to remove a reaction in the messages page"""
-        message = page.locator("#message-list [data-message-id]").filter(
-            has_text=message_text
+    async def _click_context_menu_action(self, page, message_list, message_text, action):
+        """Helper to click an action (e.g. '.edit-btn') in a message's context menu"""
+        result = await page.evaluate(
+            CONTEXT_MENU_ACTION_JS,
+            {"messageList": message_list, "messageText": message_text, "action": action},
         )
-        reaction_button = message.locator(".reaction").filter(has_text=emoji)
-        await reaction_button.click()
-        await asyncio.sleep(1)
+
+        if not result["success"]:
+            raise Exception(
+                f"Could not click {action}: {result.get('error', 'Unknown error')}"
+            )
 
     async def _edit_message_in_widget(self, page, original_text, new_text):
         """Helper to edit a message in the DM widget"""
-        await page.evaluate(
-            """(messageText) => {
-            const messages = document.querySelectorAll('#widget-message-list [data-message-id]');
-            for (const msg of messages) {
-                if (msg.textContent.includes(messageText)) {
-                    const contextMenuBtns = msg.querySelectorAll('.context-menu-btn');
-                    for (const btn of contextMenuBtns) {
-                        if (btn.offsetParent !== null) {
-                            btn.click();
-                            return true;
-                        }
-                    }
-                }
-            }
-            return false;
-        }""",
-            original_text,
-        )
-
-        await asyncio.sleep(0.5)
-
-        await page.evaluate(
-            """() => {
-            const editBtn = document.querySelector('#fixed-chat-widget .edit-btn');
-            if (editBtn) {
-                editBtn.click();
-                return true;
-            }
-            return false;
-        }"""
+        await self._click_context_menu_action(
+            page, WIDGET_MESSAGE_LIST, original_text, ".edit-btn"
         )
 
-        await asyncio.sleep(0.3)
+        # The save button appears once the widget is in edit mode
+        save_btn = page.locator("#fixed-chat-widget .edit-save-btn")
+        await expect(save_btn).to_be_visible()
 
         message_input = page.locator("#widget-message-input")
         await message_input.fill(new_text)
-        save_btn = page.locator("#fixed-chat-widget .edit-save-btn")
         await save_btn.click()
-        await asyncio.sleep(1)
+        await expect(
+            page.locator(WIDGET_MESSAGE_LIST).get_by_text(new_text)
+        ).to_be_visible()
 
     async def _edit_message_in_messages_page(self, page, original_text, new_text):
         """Helper to edit a message in the messages page"""
-        result = await page.evaluate(
-            """(messageText) => {
-            const messages = document.querySelectorAll('#message-list [data-message-id]');
-            for (const msg of messages) {
-                if (msg.textContent.includes(messageText)) {
-                    const contextMenuBtns = msg.querySelectorAll('.context-menu-btn');
-                    let contextMenuBtn = null;
-                    for (const btn of contextMenuBtns) {
-                        if (btn.offsetParent !== null) {
-                            contextMenuBtn = btn;
-                            break;
-                        }
-                    }
-
-                    if (!contextMenuBtn) {
-                        return {success: false, error: 'Context menu button not found or not visible'};
-                    }
-
-                    contextMenuBtn.click();
-
-                    const contextMenu = contextMenuBtn.parentElement.querySelector('.context-menu');
-                    if (!contextMenu) {
-                        return {success: false, error: 'Context menu element not found'};
-                    }
-
-                    contextMenu.classList.remove('hidden');
-
-                    const editBtn = contextMenu.querySelector('.edit-btn');
-                    if (!editBtn) {
-                        return {success: false, error: 'Edit button not found in context menu'};
-                    }
-
-                    editBtn.click();
-                    return {success: true};
-                }
-            }
-            return {success: false, error: 'Message not found'};
-        }""",
-            original_text,
+        await self._click_context_menu_action(
+            page, MESSAGE_LIST, original_text, ".edit-btn"
         )
 
-        if not result["success"]:
-            raise Exception(
-                f"Could not edit message: {result.get('error', 'Unknown error')}"
-            )
-
-        await asyncio.sleep(0.5)
+        # The save button appears once the page is in edit mode
+        save_btn = page.locator(".edit-save-btn")
+        await expect(save_btn).to_be_visible()
 
         message_input = page.locator("#message-input")
         await message_input.fill(new_text)
-
-        await asyncio.sleep(0.3)
-
-        save_btn = page.locator(".edit-save-btn")
         await save_btn.click()
-        await asyncio.sleep(1)
+        await expect(page.locator(MESSAGE_LIST).get_by_text(new_text)).to_be_visible()
 
-    async def _delete_message_in_widget(self, page, message_text):
-        """Helper to delete a message in the DM widget"""
-        result = await page.evaluate(
-            """(messageText) => {
-            const messages = document.querySelectorAll('#widget-message-list [data-message-id]');
-            for (const msg of messages) {
-                if (msg.textContent.includes(messageText)) {
-                    const contextMenuBtns = msg.querySelectorAll('.context-menu-btn');
-                    let contextMenuBtn = null;
-                    for (const btn of contextMenuBtns) {
-                        if (btn.offsetParent !== null) {
-                            contextMenuBtn = btn;
-                            break;
-                        }
-                    }
-
-                    if (!contextMenuBtn) {
-                        return {success: false, error: 'Context menu button not found or not visible'};
-                    }
-
-                    contextMenuBtn.click();
-
-                    const contextMenu = contextMenuBtn.parentElement.querySelector('.context-menu');
-                    if (!contextMenu) {
-                        return {success: false, error: 'Context menu element not found'};
-                    }
-
-                    contextMenu.classList.remove('hidden');
-
-                    const deleteBtn = contextMenu.querySelector('.delete-btn');
-                    if (!deleteBtn) {
-                        return {success: false, error: 'Delete button not found in context menu'};
-                    }
-
-                    deleteBtn.click();
-                    return {success: true};
-                }
-            }
-            return {success: false, error: 'Message not found'};
-        }""",
-            message_text,
+    async def _delete_message(self, page, message_list, message_text):
+        """Helper to delete a message in the given message list"""
+        await self._click_context_menu_action(
+            page, message_list, message_text, ".delete-btn"
         )
 
-        if not result["success"]:
-            raise Exception(
-                f"Could not delete message: {result.get('error', 'Unknown error')}"
-            )
-
-        await asyncio.sleep(1)
-
-    async def _delete_message_in_messages_page(self, page, message_text):
-        """Helper to delete a message in the messages page"""
-        result = await page.evaluate(
-            """(messageText) => {
-            const messages = document.querySelectorAll('#message-list [data-message-id]');
-            for (const msg of messages) {
-                if (msg.textContent.includes(messageText)) {
-                    const contextMenuBtns = msg.querySelectorAll('.context-menu-btn');
-                    let contextMenuBtn = null;
-                    for (const btn of contextMenuBtns) {
-                        if (btn.offsetParent !== null) {
-                            contextMenuBtn = btn;
-                            break;
-                        }
-                    }
-
-                    if (!contextMenuBtn) {
-                        return {success: false, error: 'Context menu button not found or not visible'};
-                    }
-
-                    contextMenuBtn.click();
-
-                    const contextMenu = contextMenuBtn.parentElement.querySelector('.context-menu');
-                    if (!contextMenu) {
-                        return {success: false, error: 'Context menu element not found'};
-                    }
-
-                    contextMenu.classList.remove('hidden');
-
-                    const deleteBtn = contextMenu.querySelector('.delete-btn');
-                    if (!deleteBtn) {
-                        return {success: false, error: 'Delete button not found in context menu'};
-                    }
-
-                    deleteBtn.click();
-                    return {success: true};
-                }
-            }
-            return {success: false, error: 'Message not found'};
-        }""",
-            message_text,
-        )
-
-        if not result["success"]:
-            raise Exception(
-                f"Could not delete message: {result.get('error', 'Unknown error')}"
-            )
-
-        await asyncio.sleep(1)
+        # The message text is replaced by the deleted indicator
+        await expect(page.locator(message_list).get_by_text(message_text)).to_have_count(0)